@@ -42,6 +42,22 @@ DEFAULT_TOOL_TTL: dict[str, int] = {
 }
 
 
+def canonical_args(args: dict[str, Any]) -> str:
+    """Encode tool arguments as canonical JSON.
+
+    Keys are sorted and whitespace dropped, so equal arguments always encode
+    the same way. The cache and the parallel executor's in-batch dedup both
+    key calls on this form, so they agree on which calls are identical.
+
+    Args:
+        args: Dictionary of tool arguments.
+
+    Returns:
+        Compact JSON with sorted keys; values JSON can't encode use str().
+    """
+    return json.dumps(args, sort_keys=True, separators=(",", ":"), default=str)
+
+
 @dataclass
 class CacheEntry:
     """A single cached tool result.
@@ -99,19 +115,31 @@ class ToolCache:
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     stats: CacheStats = field(default_factory=CacheStats)
 
-    def _generate_key(self, tool_name: str, args: dict[str, Any]) -> str:
+    @staticmethod
+    def _hash_args(args: dict[str, Any]) -> str:
+        """Hash tool arguments into a short, deterministic digest.
+
+        Args:
+            args: Dictionary of tool arguments.
+
+        Returns:
+            First 16 hex characters of the SHA-256 of the canonical JSON form.
+        """
+        return hashlib.sha256(canonical_args(args).encode()).hexdigest()[:16]
+
+    def _generate_key(self, tool_name: str, args: dict[str, Any], args_hash: str | None = None) -> str:
         """Generate a cache key from tool name and arguments.
 
         Args:
             tool_name: Name of the tool.
             args: Dictionary of tool arguments.
+            args_hash: Precomputed hash of args, if the caller already has it.
 
         Returns:
             A unique string key for the tool+args combination.
         """
-        # Sort args for deterministic key generation
-        args_json = json.dumps(args, sort_keys=True, default=str)
-        args_hash = hashlib.sha256(args_json.encode()).hexdigest()[:16]
+        if args_hash is None:
+            args_hash = self._hash_args(args)
         return f"{tool_name}:{args_hash}"
 
     def _get_ttl(self, tool_name: str) -> int:
@@ -197,10 +225,9 @@ class ToolCache:
         if not cacheable:
             return
 
-        key = self._generate_key(tool_name, args)
+        args_hash = self._hash_args(args)
+        key = self._generate_key(tool_name, args, args_hash)
         effective_ttl = ttl if ttl is not None else self._get_ttl(tool_name)
-        args_json = json.dumps(args, sort_keys=True, default=str)
-        args_hash = hashlib.sha256(args_json.encode()).hexdigest()[:16]
 
         entry = CacheEntry(
             value=value,
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from chapgent.core.cancellation import CancellationToken
 from chapgent.core.logging import logger
-from chapgent.core.parallel import execute_tools_parallel
+from chapgent.core.parallel import PERMISSION_DENIED_MESSAGE, execute_tools_parallel
 from chapgent.core.providers import LLMError, LLMResponse, TokenUsage, classify_llm_error
 from chapgent.core.providers import TextBlock as ProvTextBlock
 from chapgent.core.providers import ToolUseBlock as ProvToolUseBlock
@@ -291,7 +291,9 @@ async def conversation_loop(
 
             for tool_result in results:
                 # Yield appropriate event type
-                if tool_result.is_error and "Permission denied" in tool_result.result:
+                # Exact match, so tool errors that merely mention "Permission denied"
+                # (e.g. an OS EACCES) are reported as ordinary tool results
+                if tool_result.is_error and tool_result.result == PERMISSION_DENIED_MESSAGE:
                     yield LoopEvent(
                         type="permission_denied",
                         tool_name=tool_result.tool_name,
@@ -8,9 +8,10 @@ operations that affect the same resources.
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, cast
 
+from chapgent.core.cache import canonical_args
 from chapgent.core.cancellation import CancellationToken
 
 if TYPE_CHECKING:
@@ -35,6 +36,13 @@ PATH_ARGUMENTS: frozenset[str] = frozenset(
     }
 )
 
+# Upper bound on tools running at once within a parallel batch, to cap open
+# files, subprocesses, and buffered output when the LLM requests many reads
+MAX_PARALLEL_TOOLS = 8
+
+# Result text for a tool call the user declined; the loop matches on it exactly
+PERMISSION_DENIED_MESSAGE = "Error: Permission denied by user."
+
 
 @dataclass
 class ToolExecution:
@@ -109,15 +117,30 @@ def extract_affected_paths(tool_name: str, args: dict[str, Any]) -> set[str]:
     """
     paths: set[str] = set()
 
-    for arg_name in PATH_ARGUMENTS:
-        if arg_name in args:
-            value = args[arg_name]
-            if isinstance(value, str) and value:
-                paths.add(value)
+    # Only visit the path-like arguments actually present in this call
+    for arg_name in PATH_ARGUMENTS.intersection(args):
+        value = args[arg_name]
+        if isinstance(value, str) and value:
+            paths.add(value)
 
     return paths
 
 
+def call_key(tool_name: str, args: dict[str, Any]) -> str:
+    """Build a key identifying a tool call by name and arguments.
+
+    Two calls with the same key are interchangeable for read-only tools.
+
+    Args:
+        tool_name: Name of the tool.
+        args: Arguments passed to the tool.
+
+    Returns:
+        The tool name joined with canonical_args of the arguments.
+    """
+    return f"{tool_name}:{canonical_args(args)}"
+
+
 def paths_conflict(paths1: set[str], paths2: set[str]) -> bool:
     """Check if two sets of paths conflict (overlap or have parent-child relationship).
 
@@ -268,7 +291,7 @@ async def execute_single_tool(
         return ToolResult(
             tool_use_id=tool_use.id,
             tool_name=tool_use.name,
-            result="Error: Permission denied by user.",
+            result=PERMISSION_DENIED_MESSAGE,
             is_error=True,
         )
 
@@ -321,12 +344,37 @@ async def execute_batch(
         List of tool results in the same order as the batch executions.
     """
     if batch.can_parallelize and len(batch.executions) > 1:
-        # Execute in parallel
-        tasks = [execute_single_tool(exec_item, agent) for exec_item in batch.executions]
-        return list(await asyncio.gather(*tasks))
+        # Execute in parallel (at most MAX_PARALLEL_TOOLS at a time), running
+        # identical calls (same tool and args) only once
+        slots: dict[str, int] = {}
+        unique: list[ToolExecution] = []
+        slot_of: list[int] = []
+        for exec_item in batch.executions:
+            key = call_key(exec_item.tool_use.name, exec_item.tool_use.input)
+            if key not in slots:
+                slots[key] = len(unique)
+                unique.append(exec_item)
+            slot_of.append(slots[key])
+
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOLS)
+
+        async def run_bounded(exec_item: ToolExecution) -> ToolResult:
+            async with semaphore:
+                return await execute_single_tool(exec_item, agent)
+
+        shared = await asyncio.gather(*(run_bounded(exec_item) for exec_item in unique))
+
+        # Fan shared results back out, re-labelled with each caller's tool_use id
+        results: list[ToolResult] = []
+        for exec_item, slot in zip(batch.executions, slot_of, strict=True):
+            result = shared[slot]
+            if result.tool_use_id != exec_item.tool_use.id:
+                result = replace(result, tool_use_id=exec_item.tool_use.id)
+            results.append(result)
+        return results
     else:
         # Execute sequentially
-        results: list[ToolResult] = []
+        results = []
         for exec_item in batch.executions:
             result = await execute_single_tool(exec_item, agent)
             results.append(result)
@@ -366,17 +414,24 @@ async def execute_tools_parallel(
     # Group into batches
     batches = group_into_batches(executions)
 
-    # Execute batches sequentially, items within parallelizable batches in parallel
-    results: list[ToolResult] = []
+    # Execute batches sequentially, items within parallelizable batches in parallel.
+    # Batches are contiguous runs of the input, so each batch's results are written
+    # straight into their slots of a preallocated list, keeping caller order.
+    results: list[ToolResult | None] = [None] * len(executions)
+    completed = 0
+    # A write's permission is only asked for once the previous batch has
+    # finished, so the user never approves a write that a failure or a
+    # cancellation then skips
     for batch in batches:
         # Check cancellation between batches (not mid-batch)
         if cancellation_token is not None and cancellation_token.is_cancelled:
             break
 
-        batch_results = await execute_batch(batch, agent)
-        results.extend(batch_results)
+        end = completed + len(batch.executions)
+        results[completed:end] = await execute_batch(batch, agent)
+        completed = end
 
-    return results
+    return cast("list[ToolResult]", results[:completed])
 
 
 def get_parallel_stats(executions: list[ToolExecution]) -> dict[str, Any]:
@@ -399,11 +454,13 @@ def get_parallel_stats(executions: list[ToolExecution]) -> dict[str, Any]:
 
     batches = group_into_batches(executions)
     max_parallel = max((len(b.executions) for b in batches if b.can_parallelize), default=1)
+    # is_read_only was resolved once in prepare_tool_execution; count it in a single pass
+    read_only = sum(e.is_read_only for e in executions)
 
     return {
         "total": len(executions),
-        "read_only": sum(1 for e in executions if e.is_read_only),
-        "write": sum(1 for e in executions if not e.is_read_only),
+        "read_only": read_only,
+        "write": len(executions) - read_only,
         "batches": len(batches),
         "max_parallel": max_parallel,
     }
@@ -5,6 +5,9 @@ from typing import Any
 
 from chapgent.tools.base import ToolRisk
 
+# Risk levels that are always approved without prompting
+AUTO_APPROVED_RISKS = frozenset({ToolRisk.LOW})
+
 
 class PermissionManager:
     """Manages tool execution permissions.
@@ -28,10 +31,10 @@ class PermissionManager:
         Returns:
             True if permitted, False if denied.
         """
-        if risk == ToolRisk.LOW:
+        if risk in AUTO_APPROVED_RISKS:
             return True
 
-        if risk == ToolRisk.MEDIUM and self.session_override:
+        if self.session_override and risk == ToolRisk.MEDIUM:
             return True
 
         # MEDIUM (without override) and HIGH always prompt
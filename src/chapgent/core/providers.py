@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from typing import Any
 
@@ -165,19 +166,19 @@ def classify_llm_error(error: Exception) -> LLMError:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUseBlock:
     id: str
     name: str
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token usage statistics from an LLM response.
 
@@ -192,7 +193,7 @@ class TokenUsage:
     total_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     content: list[TextBlock | ToolUseBlock]
     stop_reason: str | None
@@ -235,7 +236,6 @@ class ClaudeCodeProvider:
             LLMResponse containing the final text result.
         """
         import asyncio
-        import json
         import shutil
 
         # Find claude binary
@@ -344,37 +344,30 @@ class LLMProvider:
         """Send completion request to LLM.
 
         Args:
-            messages: List of message dicts (role, content).
+            messages: List of message dicts (role, content). Passed to litellm
+                as-is rather than copied, so don't mutate it until this returns.
             tools: List of available tool definitions.
             max_output_tokens: Maximum tokens in the model's response.
 
         Returns:
             LLMResponse containing content blocks and stop reason.
         """
-        # Format tools for litellm
-        formatted_tools = None
+        request: dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": max_output_tokens,  # litellm uses max_tokens
+        }
+        # Only pass optional settings that are set, leaving litellm's defaults otherwise
+        if self.api_key:
+            request["api_key"] = self.api_key
+        if self.base_url:
+            request["api_base"] = self.base_url
+        if self.extra_headers:
+            request["extra_headers"] = self.extra_headers
         if tools:
-            formatted_tools = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.input_schema,
-                    },
-                }
-                for tool in tools
-            ]
-
-        response = await litellm.acompletion(
-            model=self.model,
-            api_key=self.api_key,
-            api_base=self.base_url,
-            extra_headers=self.extra_headers,
-            messages=messages,
-            tools=formatted_tools,
-            max_tokens=max_output_tokens,  # litellm uses max_tokens
-        )
+            request["tools"] = [tool.function_spec for tool in tools]
+
+        response = await litellm.acompletion(**request)
 
         choice = response.choices[0]
         message = choice.message
@@ -386,12 +379,7 @@ class LLMProvider:
 
         if message.tool_calls:
             for tool_call in message.tool_calls:
-                # litellm returns arguments as string JSON sometimes, or dict?
-                # usually it handles it, but let's assume it might need parsing if it's a string
-                # or rely on litellm object structure.
-                # functionality-wise, litellm returns an object with `arguments` usually as a string JSON for OAI.
-                import json
-
+                # OpenAI-style providers send arguments as a JSON string; some send a dict already
                 args = tool_call.function.arguments
                 if isinstance(args, str):
                     try:
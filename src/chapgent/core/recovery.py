@@ -9,7 +9,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar
 
 
 class ErrorType(str, Enum):
@@ -32,7 +32,11 @@ class ErrorType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Error types worth retrying when classified from the message alone
+RETRYABLE_ERROR_TYPES: frozenset[ErrorType] = frozenset({ErrorType.TIMEOUT, ErrorType.CONNECTION_ERROR})
+
+
+@dataclass(slots=True)
 class RecoveryAction:
     """Suggested recovery action for a tool error.
 
@@ -185,15 +189,16 @@ ERROR_PATTERNS: dict[str, dict[str, Any]] = {
     },
 }
 
-# Regex patterns for error message analysis
+# Regex patterns for error message analysis. Written in lowercase so they can
+# run on the lowercased message without per-character case folding.
 MESSAGE_PATTERNS: list[tuple[re.Pattern[str], ErrorType, list[str]]] = [
     (
-        re.compile(r"No such file or directory", re.IGNORECASE),
+        re.compile(r"no such file or directory", re.IGNORECASE),
         ErrorType.FILE_NOT_FOUND,
         ["The specified path does not exist.", "Use find_files to locate the file."],
     ),
     (
-        re.compile(r"Permission denied", re.IGNORECASE),
+        re.compile(r"permission denied", re.IGNORECASE),
         ErrorType.PERMISSION_DENIED,
         ["Insufficient permissions.", "Check file permissions."],
     ),
@@ -203,22 +208,22 @@ MESSAGE_PATTERNS: list[tuple[re.Pattern[str], ErrorType, list[str]]] = [
         ["Not inside a git repository.", "Run git init or navigate to a repo."],
     ),
     (
-        re.compile(r"CONFLICT|merge conflict", re.IGNORECASE),
+        re.compile(r"conflict|merge conflict", re.IGNORECASE),
         ErrorType.GIT_CONFLICT,
         ["Git merge conflict detected.", "Resolve conflicts before proceeding."],
     ),
     (
-        re.compile(r"No (such )?remote", re.IGNORECASE),
+        re.compile(r"no (such )?remote", re.IGNORECASE),
         ErrorType.GIT_NO_REMOTE,
         ["No remote repository configured.", "Add a remote with: git remote add origin <url>"],
     ),
     (
-        re.compile(r"No module named ['\"]?(\w+)", re.IGNORECASE),
+        re.compile(r"no module named ['\"]?(\w+)", re.IGNORECASE),
         ErrorType.MODULE_NOT_FOUND,
         ["Python module not installed.", "Install with: pip install {module}"],
     ),
     (
-        re.compile(r"ModuleNotFoundError", re.IGNORECASE),
+        re.compile(r"modulenotfounderror", re.IGNORECASE),
         ErrorType.MODULE_NOT_FOUND,
         ["Required module not found.", "Install missing dependencies."],
     ),
@@ -228,23 +233,51 @@ MESSAGE_PATTERNS: list[tuple[re.Pattern[str], ErrorType, list[str]]] = [
         ["Operation timed out.", "Try again or increase timeout."],
     ),
     (
-        re.compile(r"Connection (refused|reset|closed)", re.IGNORECASE),
+        re.compile(r"connection (refused|reset|closed)", re.IGNORECASE),
         ErrorType.CONNECTION_ERROR,
         ["Connection failed.", "Check network and target availability."],
     ),
     (
-        re.compile(r"ECONNREFUSED|ENOTFOUND|EHOSTUNREACH", re.IGNORECASE),
+        re.compile(r"econnrefused|enotfound|ehostunreach", re.IGNORECASE),
         ErrorType.CONNECTION_ERROR,
         ["Network connection error.", "Verify the target address."],
     ),
     (
-        re.compile(r"Invalid JSON|JSON.*invalid|Expecting.*JSON", re.IGNORECASE),
+        re.compile(r"invalid json|json.*invalid|expecting.*json", re.IGNORECASE),
         ErrorType.JSON_DECODE_ERROR,
         ["Invalid JSON data.", "Verify JSON format."],
     ),
 ]
 
 
+# Escapes that can spell an uppercase character (\x41, \u0041, octal \101) or
+# refer back to a captured group, which lowercasing the message would break
+_CASE_SENSITIVE_ESCAPE = re.compile(r"\\[xu0-9]")
+
+# A message pattern with its lowercase variant (or None), error type and suggestions
+_ScanEntry = tuple[re.Pattern[str] | None, re.Pattern[str], ErrorType, list[str]]
+
+
+def _lowercase_variant(regex: re.Pattern[str]) -> re.Pattern[str] | None:
+    """Compile a case-sensitive copy of a pattern for matching lowercased ASCII text.
+
+    On ASCII text, a lowercase pattern without case folding finds a match in
+    the lowercased message whenever the case-insensitive original finds one
+    in the message itself, and skips the folding cost.
+
+    Args:
+        regex: A case-insensitive message pattern.
+
+    Returns:
+        The case-sensitive copy, or None if the pattern source is not plain
+        lowercase ASCII and must always run case-insensitively.
+    """
+    source = regex.pattern
+    if not source.isascii() or source != source.lower() or _CASE_SENSITIVE_ESCAPE.search(source):
+        return None
+    return re.compile(source, regex.flags & ~re.IGNORECASE)
+
+
 class ErrorRecovery:
     """Intelligent error handling with retry suggestions.
 
@@ -252,10 +285,23 @@ class ErrorRecovery:
     recovery suggestions based on known error patterns.
     """
 
+    # Lookups derived from the builtin tables, shared by every instance that
+    # has not registered custom patterns
+    _shared_class_patterns: ClassVar[dict[type, dict[str, Any]] | None] = None
+    _shared_scan_patterns: ClassVar[list[_ScanEntry] | None] = None
+
     def __init__(self) -> None:
-        """Initialize the error recovery system."""
-        self._error_patterns = ERROR_PATTERNS.copy()
-        self._message_patterns = MESSAGE_PATTERNS.copy()
+        """Initialize the error recovery system.
+
+        Instances share the builtin pattern tables and copy them only when a
+        custom pattern is added, so creating one allocates almost nothing.
+        """
+        self._error_patterns = ERROR_PATTERNS
+        self._message_patterns = MESSAGE_PATTERNS
+        # Error patterns keyed by resolved exception class, built on first use
+        self._class_patterns: dict[type, dict[str, Any]] | None = None
+        # Message patterns paired with their lowercase variants, built on first use
+        self._scan_patterns: list[_ScanEntry] | None = None
 
     def handle_tool_error(
         self,
@@ -274,50 +320,29 @@ class ErrorRecovery:
             RecoveryAction with suggestions and retry flag.
         """
         context = context or {}
-        error_class = type(error).__name__
         error_msg = str(error)
 
-        # First, try to match by exception class name
-        if error_class in self._error_patterns:
-            pattern = self._error_patterns[error_class]
-            suggestions = self._contextualize_suggestions(pattern["suggest"].copy(), tool_name, error_msg, context)
+        # First, try to match by exception class, most-derived class first
+        pattern = self._match_class(type(error))
+        if pattern is not None:
+            suggestions = self._contextualize_suggestions(pattern["suggest"], tool_name, error_msg, context)
             return RecoveryAction(
                 error_type=pattern["type"],
                 should_retry=pattern["auto_retry"],
                 suggestions=suggestions,
             )
 
-        # Try matching parent classes
-        for exc_class_name, pattern in self._error_patterns.items():
-            try:
-                # Check if error is instance of the exception class
-                exc_class = self._resolve_exception_class(exc_class_name)
-                if exc_class and isinstance(error, exc_class):
-                    suggestions = self._contextualize_suggestions(
-                        pattern["suggest"].copy(), tool_name, error_msg, context
-                    )
-                    return RecoveryAction(
-                        error_type=pattern["type"],
-                        should_retry=pattern["auto_retry"],
-                        suggestions=suggestions,
-                    )
-            except (ImportError, AttributeError):
-                continue
-
         # Try matching error message patterns
-        for regex, error_type, base_suggestions in self._message_patterns:
-            match = regex.search(error_msg)
-            if match:
-                suggestions = self._contextualize_suggestions(
-                    base_suggestions.copy(), tool_name, error_msg, context, match
-                )
-                # Determine retry based on error type
-                should_retry = error_type in (ErrorType.TIMEOUT, ErrorType.CONNECTION_ERROR)
-                return RecoveryAction(
-                    error_type=error_type,
-                    should_retry=should_retry,
-                    suggestions=suggestions,
-                )
+        message_match = self._match_message(error_msg)
+        if message_match is not None:
+            match, error_type, base_suggestions = message_match
+            suggestions = self._contextualize_suggestions(base_suggestions, tool_name, error_msg, context, match)
+            should_retry = error_type in RETRYABLE_ERROR_TYPES
+            return RecoveryAction(
+                error_type=error_type,
+                should_retry=should_retry,
+                suggestions=suggestions,
+            )
 
         # Unknown error - provide generic suggestions
         return RecoveryAction(
@@ -330,6 +355,77 @@ class ErrorRecovery:
             ],
         )
 
+    def _match_class(self, error_class: type) -> dict[str, Any] | None:
+        """Find the error pattern for an exception class or its nearest ancestor.
+
+        Walks the class MRO, checking each class by name and by resolved class,
+        so subclasses fall back to their closest registered parent.
+
+        Args:
+            error_class: Type of the raised exception.
+
+        Returns:
+            The matching error pattern, or None if no class in the MRO is registered.
+        """
+        if self._class_patterns is None:
+            shared = self._error_patterns is ERROR_PATTERNS
+            class_patterns = ErrorRecovery._shared_class_patterns if shared else None
+            if class_patterns is None:
+                class_patterns = {}
+                for exc_class_name, pattern in self._error_patterns.items():
+                    exc_class = self._resolve_exception_class(exc_class_name)
+                    if isinstance(exc_class, type):
+                        # Earlier entries win when names alias the same class
+                        class_patterns.setdefault(exc_class, pattern)
+                if shared:
+                    ErrorRecovery._shared_class_patterns = class_patterns
+            self._class_patterns = class_patterns
+
+        for cls in error_class.__mro__:
+            match = self._error_patterns.get(cls.__name__) or self._class_patterns.get(cls)
+            if match is not None:
+                return match
+        return None
+
+    def _match_message(self, error_msg: str) -> tuple[re.Match[str], ErrorType, list[str]] | None:
+        """Find the first message pattern that matches an error message.
+
+        Args:
+            error_msg: The error message to scan.
+
+        Returns:
+            Tuple of (match, error type, base suggestions), or None if no pattern matches.
+        """
+        if error_msg.isascii():
+            if self._scan_patterns is None:
+                shared = self._message_patterns is MESSAGE_PATTERNS
+                scan_patterns = ErrorRecovery._shared_scan_patterns if shared else None
+                if scan_patterns is None:
+                    scan_patterns = [
+                        (_lowercase_variant(regex), regex, error_type, base_suggestions)
+                        for regex, error_type, base_suggestions in self._message_patterns
+                    ]
+                    if shared:
+                        ErrorRecovery._shared_scan_patterns = scan_patterns
+                self._scan_patterns = scan_patterns
+
+            lowered = error_msg.lower()
+            for lowercase_regex, regex, error_type, base_suggestions in self._scan_patterns:
+                if lowercase_regex is not None and lowercase_regex.search(lowered) is None:
+                    continue
+                # Match the original message so groups keep their case; this
+                # also rejects hits that only exist after lowercasing, e.g. (?-i:...)
+                match = regex.search(error_msg)
+                if match:
+                    return match, error_type, base_suggestions
+            return None
+
+        for regex, error_type, base_suggestions in self._message_patterns:
+            match = regex.search(error_msg)
+            if match:
+                return match, error_type, base_suggestions
+        return None
+
     def _resolve_exception_class(self, class_name: str) -> type | None:
         """Resolve exception class from string name.
 
@@ -372,11 +468,17 @@ class ErrorRecovery:
             match: Regex match object if pattern matched.
 
         Returns:
-            Contextualized suggestion list.
+            Contextualized suggestion list. Always a new list; the base
+            suggestions are never modified.
         """
         result = []
 
         for suggestion in suggestions:
+            # Most suggestions are plain text; skip placeholder handling for them
+            if "{" not in suggestion:
+                result.append(suggestion)
+                continue
+
             # Replace placeholders
             suggestion = suggestion.replace("{tool}", tool_name)
 
@@ -415,11 +517,15 @@ class ErrorRecovery:
             suggestions: Suggestion strings.
             auto_retry: Whether to suggest automatic retry.
         """
+        if self._error_patterns is ERROR_PATTERNS:
+            self._error_patterns = ERROR_PATTERNS.copy()
         self._error_patterns[exception_name] = {
             "type": error_type,
             "suggest": suggestions,
             "auto_retry": auto_retry,
         }
+        # Rebuild the class lookup on next use
+        self._class_patterns = None
 
     def add_message_pattern(
         self,
@@ -430,8 +536,18 @@ class ErrorRecovery:
         """Register a custom message pattern.
 
         Args:
-            pattern: Regex pattern to match in error messages.
+            pattern: Regex pattern to match in error messages. Matched
+                case-insensitively.
             error_type: Classification for this error.
             suggestions: Suggestion strings.
+
+        Raises:
+            re.error: If the pattern is not a valid regular expression.
         """
-        self._message_patterns.append((re.compile(pattern, re.IGNORECASE), error_type, suggestions))
+        # Compile before touching the tables so an invalid pattern changes nothing
+        regex = re.compile(pattern, re.IGNORECASE)
+        if self._message_patterns is MESSAGE_PATTERNS:
+            self._message_patterns = MESSAGE_PATTERNS.copy()
+        self._message_patterns.append((regex, error_type, suggestions))
+        # Rebuild the scan table on next use
+        self._scan_patterns = None
@@ -1,11 +1,27 @@
+import hashlib
 import json
+import os
+import re
+import tempfile
 from pathlib import Path
+from typing import Any
 
 import aiofiles
 from pydantic import ValidationError
 
 from chapgent.session.models import Session, SessionSummary
 
+# Summary cache for list_sessions, keyed by session filename. Entries are reused
+# only while the file's (mtime_ns, size, inode) stamp is unchanged; every save
+# replaces the file, so the inode changes even when mtime and size do not.
+INDEX_FILENAME = "_index.json"
+
+# Filenames in the storage directory that are never session files
+_RESERVED_FILENAMES = frozenset({INDEX_FILENAME, "index.json"})
+
+# Session IDs that are already safe, readable filenames are used verbatim
+_SAFE_SESSION_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,127}")
+
 
 class SessionStorage:
     """JSON-based session persistence."""
@@ -21,21 +37,51 @@ class SessionStorage:
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_session_path(self, session_id: str) -> Path:
-        return self.storage_dir / f"{session_id}.json"
+        filename = f"{session_id}.json"
+        if _SAFE_SESSION_ID.fullmatch(session_id) and filename not in _RESERVED_FILENAMES:
+            return self.storage_dir / filename
+        # Anything else (separators, dots, reserved names, overlong IDs) is
+        # mapped to a digest so it can't escape or collide in the directory
+        digest = hashlib.sha256(session_id.encode()).hexdigest()[:32]
+        return self.storage_dir / f"sha256-{digest}.json"
+
+    def _adopt_legacy_file(self, session_id: str, path: Path) -> None:
+        """Move a session saved under its raw ID to its current path.
+
+        Before IDs were sanitized, every session was stored as ``{session_id}.json``.
+        For IDs that now map to a digest, such a file is renamed to ``path`` the
+        first time the session is accessed, as long as it lies directly inside
+        the storage directory and isn't a reserved file.
+        """
+        legacy_name = f"{session_id}.json"
+        if (
+            legacy_name == path.name
+            or legacy_name in _RESERVED_FILENAMES
+            or os.path.basename(legacy_name) != legacy_name
+            or (os.altsep and os.altsep in legacy_name)
+            or "\0" in legacy_name
+            or path.exists()
+        ):
+            return
+        try:
+            os.replace(self.storage_dir / legacy_name, path)
+        except OSError:
+            pass  # No legacy file, or it can't be moved
 
     async def save(self, session: Session) -> None:
         """Save a session to disk."""
         path = self._get_session_path(session.id)
+        self._adopt_legacy_file(session.id, path)
 
         # Use model_dump_json for serialization
         json_data = session.model_dump_json(indent=2)
 
-        async with aiofiles.open(path, "w") as f:
-            await f.write(json_data)
+        await _replace_file(path, json_data)
 
     async def load(self, session_id: str) -> Session | None:
         """Load a session from disk."""
         path = self._get_session_path(session_id)
+        self._adopt_legacy_file(session_id, path)
 
         if not path.exists():
             return None
@@ -46,41 +92,115 @@ class SessionStorage:
         return Session.model_validate_json(content)
 
     async def list_sessions(self) -> list[SessionSummary]:
-        """List all saved sessions."""
+        """List all saved sessions.
+
+        Summaries are served from the index for files whose stamp is unchanged;
+        only new or modified session files are parsed in full.
+        """
         if not self.storage_dir.exists():
             return []
 
+        index = await self._read_index()
+        fresh: dict[str, Any] = {}
         summaries = []
-        for file_path in self.storage_dir.glob("*.json"):
-            if file_path.name == "index.json":
-                continue
 
+        with os.scandir(self.storage_dir) as it:
+            entries = [
+                entry
+                for entry in it
+                if entry.name.endswith(".json")
+                and not entry.name.startswith(".")
+                and entry.name not in _RESERVED_FILENAMES
+            ]
+
+        for entry in entries:
             try:
-                async with aiofiles.open(file_path) as f:
-                    content = await f.read()
-
-                session = Session.model_validate_json(content)
-                summaries.append(
-                    SessionSummary(
-                        id=session.id,
-                        created_at=session.created_at,
-                        updated_at=session.updated_at,
-                        message_count=len(session.messages),
-                        working_directory=session.working_directory,
-                        metadata=session.metadata,
-                    )
-                )
-            except (OSError, json.JSONDecodeError, ValidationError):
-                # Skip corrupted or unreadable session files
+                stat = entry.stat()
+            except OSError:
                 continue
+            stamp = [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+            summary = None
+            cached = index.get(entry.name)
+            if isinstance(cached, dict) and cached.get("stamp") == stamp:
+                try:
+                    summary = SessionSummary.model_validate(cached.get("summary"))
+                except ValidationError:
+                    summary = None
+
+            if summary is None:
+                summary = await self._summarize(Path(entry.path))
+                if summary is None:
+                    # Skip corrupted or unreadable session files
+                    continue
+
+            fresh[entry.name] = {"stamp": stamp, "summary": summary.model_dump(mode="json")}
+            summaries.append(summary)
+
+        if fresh != index:
+            await self._write_index(fresh)
 
         summaries.sort(key=lambda x: x.updated_at, reverse=True)
         return summaries
 
+    async def _summarize(self, path: Path) -> SessionSummary | None:
+        """Parse a session file into its summary, or None if it can't be read."""
+        try:
+            async with aiofiles.open(path) as f:
+                content = await f.read()
+
+            session = Session.model_validate_json(content)
+        except (OSError, json.JSONDecodeError, ValidationError):
+            return None
+
+        return SessionSummary(
+            id=session.id,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+            message_count=len(session.messages),
+            working_directory=session.working_directory,
+            metadata=session.metadata,
+        )
+
+    async def _read_index(self) -> dict[str, Any]:
+        """Read the summary index, treating a missing or damaged one as empty."""
+        try:
+            async with aiofiles.open(self.storage_dir / INDEX_FILENAME) as f:
+                data = json.loads(await f.read())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    async def _write_index(self, index: dict[str, Any]) -> None:
+        """Replace the summary index. Failures are ignored; it is only a cache."""
+        try:
+            await _replace_file(self.storage_dir / INDEX_FILENAME, json.dumps(index, separators=(",", ":")))
+        except OSError:
+            pass
+
     async def delete(self, session_id: str) -> bool:
         """Delete a session."""
         path = self._get_session_path(session_id)
+        self._adopt_legacy_file(session_id, path)
         if path.exists():
             path.unlink()
             return True
         return False
+
+
+async def _replace_file(path: Path, text: str) -> None:
+    """Atomically replace a file's contents.
+
+    The text goes to a uniquely named sibling temp file that is then renamed
+    over the target. A crash mid-write never leaves a truncated file, and
+    overlapping writes to the same path never share a temp file. The temp
+    file is removed if anything fails.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        async with aiofiles.open(fd, "w") as f:
+            await f.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
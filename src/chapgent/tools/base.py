@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import inspect
+import json
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from enum import Enum
-from functools import wraps
+from functools import cached_property, wraps
 from typing import Any, ParamSpec, Protocol, TypeVar, cast
 
 from pydantic import TypeAdapter
@@ -64,6 +65,29 @@ class ToolDefinition:
     read_only: bool = False
     cacheable: bool = True
 
+    @cached_property
+    def _function_spec_json(self) -> str:
+        """Serialized function spec, built once per definition."""
+        return json.dumps(
+            {
+                "type": "function",
+                "function": {
+                    "name": self.name,
+                    "description": self.description,
+                    "parameters": self.input_schema,
+                },
+            }
+        )
+
+    @property
+    def function_spec(self) -> dict[str, Any]:
+        """Get the OpenAI-style function spec sent to the LLM.
+
+        Each call returns a fresh copy, so callers may modify it without
+        affecting later requests.
+        """
+        return cast(dict[str, Any], json.loads(self._function_spec_json))
+
 
 def _generate_schema(func: Callable[..., Any]) -> dict[str, Any]:
     """Generate JSON schema from function type hints.
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
 import shutil
+import stat
+from collections import deque
 from pathlib import Path
 from typing import Any
 
@@ -34,30 +37,52 @@ async def read_file(path: str) -> str:
     Raises:
         FileNotFoundError: If file doesn't exist.
     """
-    file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
-
-    # Check if it's a file
-    if not file_path.is_file():
-        raise IsADirectoryError(f"Path is a directory: {path}")
+    try:
+        content, file_size = await asyncio.to_thread(_read_text_head, path)
+    except (FileNotFoundError, NotADirectoryError):
+        # A file used as a directory component ("notes.txt/child") is just missing
+        raise FileNotFoundError(f"File not found: {path}") from None
+
+    if file_size > MAX_FILE_SIZE:
+        return (
+            f"{content}\n\n"
+            f"[TRUNCATED: File is {file_size:,} bytes, showing first {MAX_FILE_SIZE:,} chars. "
+            f"Use line offsets or grep for specific content.]"
+        )
 
-    # Check file size before reading
-    file_size = file_path.stat().st_size
+    return content
 
-    async with aiofiles.open(file_path, encoding="utf-8") as f:
-        # Only read up to MAX_FILE_SIZE bytes to avoid loading huge files into memory
-        content = await f.read(MAX_FILE_SIZE)
 
-        # Check if there's more content (file was truncated)
-        if file_size > MAX_FILE_SIZE:
-            return (
-                f"{content}\n\n"
-                f"[TRUNCATED: File is {file_size:,} bytes, showing first {MAX_FILE_SIZE:,} chars. "
-                f"Use line offsets or grep for specific content.]"
-            )
+def _read_text_head(path: str) -> tuple[str, int]:
+    """Read up to MAX_FILE_SIZE chars of a UTF-8 file with one open and one stat.
 
-    return content
+    Returns:
+        The (newline-normalized) text and the file size in bytes.
+    """
+    # O_NONBLOCK keeps a FIFO from blocking the open; it is a no-op for regular files
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_NONBLOCK", 0))
+    try:
+        st = os.fstat(fd)
+        if not stat.S_ISREG(st.st_mode):
+            raise IsADirectoryError(f"Path is a directory: {path}")
+
+        if st.st_size > MAX_FILE_SIZE:
+            # Too big to read whole; let the text layer stop at a char boundary
+            with open(fd, encoding="utf-8", closefd=False) as f:
+                return f.read(MAX_FILE_SIZE), st.st_size
+
+        # Common case: the whole file fits, so read it in a single call
+        chunks = []
+        while chunk := os.read(fd, max(st.st_size, 1) + 1):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    content = b"".join(chunks).decode("utf-8")
+    if "\r" in content:
+        # Match text-mode universal newlines
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content, st.st_size
 
 
 @tool(
@@ -81,24 +106,7 @@ async def list_files(path: str = ".", recursive: bool = False) -> str:
     if not root.exists():
         raise FileNotFoundError(f"Directory not found: {path}")
 
-    entries: list[dict[str, str | int | bool]] = []
-    truncated = False
-
-    if recursive:
-        # Recursive listing with limit
-        for p in root.rglob("*"):
-            if len(entries) >= MAX_LIST_ENTRIES:
-                truncated = True
-                break
-            entries.append(_path_to_entry(p, root))
-    else:
-        # Flat listing with limit
-        for p in root.iterdir():
-            if len(entries) >= MAX_LIST_ENTRIES:
-                truncated = True
-                break
-            entries.append(_path_to_entry(p, root))
-
+    entries, truncated = await asyncio.to_thread(_scan_entries, path, recursive)
     result = json.dumps(entries, indent=2)
 
     if truncated:
@@ -110,13 +118,50 @@ async def list_files(path: str = ".", recursive: bool = False) -> str:
     return result
 
 
-def _path_to_entry(path: Path, root: Path) -> dict[str, Any]:
-    """Convert a path to a dictionary entry."""
-    stats = path.stat()
+def _scan_entries(root: str, recursive: bool) -> tuple[list[dict[str, Any]], bool]:
+    """Walk root breadth-first with os.scandir, up to MAX_LIST_ENTRIES entries.
+
+    Returns:
+        The entries and whether the listing was truncated.
+    """
+    entries: list[dict[str, Any]] = []
+    pending: deque[tuple[str, str]] = deque([(root, "")])
+
+    while pending:
+        directory, rel_dir = pending.popleft()
+        try:
+            it = os.scandir(directory)
+        except PermissionError:
+            if directory == root:
+                raise
+            continue
+
+        with it:
+            for entry in it:
+                if len(entries) >= MAX_LIST_ENTRIES:
+                    return entries, True
+
+                rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                entries.append(_dir_entry_to_entry(entry, rel_path))
+
+                # Don't descend through symlinks, so link cycles can't loop forever
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, rel_path))
+
+    return entries, False
+
+
+def _dir_entry_to_entry(entry: os.DirEntry[str], rel_path: str) -> dict[str, Any]:
+    """Convert a scandir entry to a dictionary entry."""
+    try:
+        stats = entry.stat()
+    except OSError:
+        # Dangling symlink: describe the link itself
+        stats = entry.stat(follow_symlinks=False)
     return {
-        "name": path.name,
-        "path": str(path.relative_to(root)) if path != root else ".",
-        "is_dir": path.is_dir(),
+        "name": entry.name,
+        "path": rel_path,
+        "is_dir": entry.is_dir(),
         "size": stats.st_size,
         "modified": stats.st_mtime,
     }
@@ -144,18 +189,31 @@ async def edit_file(path: str, old_str: str, new_str: str) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    async with aiofiles.open(file_path, encoding="utf-8") as f:
-        content = await f.read()
+    await asyncio.to_thread(_replace_in_file, file_path, old_str, new_str)
 
-    if old_str not in content:
-        raise ValueError(f"String not found in file: {old_str}")
+    return f"Successfully replaced occurrences in {path}"
 
-    new_content = content.replace(old_str, new_str)
 
-    async with aiofiles.open(file_path, mode="w", encoding="utf-8") as f:
-        await f.write(new_content)
+def _replace_in_file(file_path: Path, old_str: str, new_str: str) -> None:
+    """Replace every occurrence of old_str in a UTF-8 file.
 
-    return f"Successfully replaced occurrences in {path}"
+    Files with plain LF endings are edited as bytes, skipping a decode and
+    re-encode of the whole file. Anything else takes the text-mode route so
+    newline translation behaves as it always has.
+    """
+    data = file_path.read_bytes()
+
+    if b"\r" in data or os.linesep != "\n":
+        content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        if old_str not in content:
+            raise ValueError(f"String not found in file: {old_str}")
+        file_path.write_text(content.replace(old_str, new_str), encoding="utf-8")
+        return
+
+    old_bytes = old_str.encode("utf-8")
+    if old_bytes not in data:
+        raise ValueError(f"String not found in file: {old_str}")
+    file_path.write_bytes(data.replace(old_bytes, new_str.encode("utf-8")))
 
 
 @tool(
@@ -7,9 +7,17 @@ and finding files matching glob patterns.
 from __future__ import annotations
 
 import asyncio
+import fnmatch
+import functools
+import itertools
 import json
+import mmap
+import operator
+import os
 import re
 import shutil
+import stat
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
 from chapgent.tools.base import ToolCategory, ToolRisk, tool
@@ -17,12 +25,56 @@ from chapgent.tools.base import ToolCategory, ToolRisk, tool
 # Limit to prevent context window overflow
 MAX_FIND_RESULTS = 200
 
+# Files larger than this are memory-mapped when checked for a literal (1 MiB)
+MMAP_THRESHOLD = 1 << 20
 
+# Directory and file names skipped by searches, in addition to hidden (dot) names
+_IGNORED_NAMES = frozenset({"node_modules", "__pycache__", ".git", "venv", ".venv"})
+
+# Characters with special meaning in a regex; patterns without any are plain literals
+_REGEX_METACHARS = frozenset(".^$*+?()[]{}|\\")
+
+
+# Characters with special meaning in a glob segment
+_GLOB_METACHARS = frozenset("*?[")
+
+# A compiled glob segment: None stands for "**", a str is a literal name, anything else tests one name
+_GlobSegment = str | Callable[[str], object] | None
+
+
+def _is_literal(pattern: str) -> bool:
+    """Check if a regex pattern is a plain literal string."""
+    return not _REGEX_METACHARS.intersection(pattern)
+
+
+# Marker of a "match" event in rg --json output
+_RG_MATCH_EVENT = b'"type":"match"'
+
+# Stream buffer limit for one rg --json event; long matched lines make long events
+_RG_LINE_LIMIT = 16 * 1024 * 1024
+
+
+@functools.cache
 def _is_ripgrep_available() -> bool:
-    """Check if ripgrep (rg) is available on the system."""
+    """Check if ripgrep (rg) is available on the system.
+
+    The PATH lookup runs once per process; the result is cached.
+    """
     return shutil.which("rg") is not None
 
 
+def _stat_root(path: str) -> os.stat_result:
+    """Stat a search root once, for both the existence and type checks.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Path not found: {path}") from None
+
+
 async def _grep_with_ripgrep(
     pattern: str,
     path: str,
@@ -43,25 +95,50 @@ async def _grep_with_ripgrep(
     if file_pattern:
         cmd.extend(["--glob", file_pattern])
 
-    cmd.extend([pattern, path])
+    if _is_literal(pattern):
+        # Literal search skips regex compilation and uses rg's fastest substring path
+        cmd.append("--fixed-strings")
+
+    # "--" so patterns or paths starting with "-" aren't parsed as flags
+    cmd.extend(["--", pattern, path])
 
     try:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_RG_LINE_LIMIT,
         )
-        stdout, _ = await proc.communicate()
     except FileNotFoundError:
         # ripgrep not found
         return []
 
     results: list[dict[str, str | int]] = []
-    for line in stdout.decode("utf-8", errors="replace").splitlines():
-        if not line.strip():
-            continue
-        try:
-            data = json.loads(line)
+    if proc.stdout is None:
+        return results
+
+    try:
+        # Read events as rg emits them, so we can stop it once we have enough
+        while True:
+            try:
+                line = await proc.stdout.readline()
+            except ValueError:
+                # One event is longer than the stream limit. The reader has already
+                # dropped what it buffered; the rest of that event fails the checks
+                # below and is skipped with it.
+                continue
+            if not line:
+                break
+            # Only parse match events; begin/end/context/summary lines are skipped
+            # unparsed. Inside JSON strings the quotes would be escaped, so this
+            # exact byte sequence only occurs as the event's own type field.
+            if _RG_MATCH_EVENT not in line:
+                continue
+            try:
+                data = json.loads(line)
+            except ValueError:
+                # Malformed JSON or invalid UTF-8
+                continue
             if data.get("type") == "match":
                 match_data = data.get("data", {})
                 submatches = match_data.get("submatches", [])
@@ -76,8 +153,14 @@ async def _grep_with_ripgrep(
                 )
                 if len(results) >= max_results:
                     break
-        except json.JSONDecodeError:
-            continue
+    finally:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass  # Process already finished
+        # Reap the process to avoid zombies
+        await proc.wait()
 
     return results
 
@@ -92,8 +175,7 @@ async def _grep_with_python(
 ) -> list[dict[str, str | int]]:
     """Execute grep search using pure Python."""
     search_path = Path(path)
-    if not search_path.exists():
-        raise FileNotFoundError(f"Path not found: {path}")
+    single_file = stat.S_ISREG(_stat_root(path).st_mode)
 
     flags = re.IGNORECASE if ignore_case else 0
     try:
@@ -101,54 +183,155 @@ async def _grep_with_python(
     except re.error as e:
         raise ValueError(f"Invalid regex pattern: {e}") from e
 
-    results: list[dict[str, str | int]] = []
+    # Case-insensitive searches skip the prefilter; a literal's case varies
+    prefix = "" if ignore_case else _literal_prefix(pattern)
+
+    # The walk and the matching are blocking work; keep them off the event loop
+    return await asyncio.to_thread(_scan_files, regex, search_path, single_file, file_pattern, prefix, max_results)
+
+
+def _scan_files(
+    regex: re.Pattern[str],
+    search_path: Path,
+    single_file: bool,
+    file_pattern: str | None,
+    prefix: str,
+    max_results: int,
+) -> list[dict[str, str | int]]:
+    """Search files under search_path in walk order, keeping the first max_results matches."""
+    # islice stops pulling once it has enough, so the walk and any file read stop there too
+    matches = _iter_matches(regex, search_path, single_file, file_pattern, prefix)
+    return list(itertools.islice(matches, max(max_results, 0)))
 
+
+def _iter_matches(
+    regex: re.Pattern[str],
+    search_path: Path,
+    single_file: bool,
+    file_pattern: str | None,
+    prefix: str,
+) -> Iterator[dict[str, str | int]]:
+    """Yield matches from the files under search_path, lazily in walk order."""
     # Collect files to search
-    if search_path.is_file():
-        files = [search_path]
+    files: Iterator[Path]
+    if single_file:
+        files = iter([search_path])
+    elif file_pattern and "/" in file_pattern:
+        # Path-shaped patterns need glob's segment matching; like rglob, they may start at any depth
+        segments, _ = _compile_glob(f"**/{file_pattern}")
+        files = (search_path / rel for rel in _iter_glob(str(search_path), segments, False, None, "file"))
     else:
-        if file_pattern:
-            files = list(search_path.rglob(file_pattern))
-        else:
-            files = [f for f in search_path.rglob("*") if f.is_file()]
+        files = _iter_files(search_path, file_pattern)
 
-    # Filter out hidden and common ignore patterns
-    def should_include(f: Path) -> bool:
-        parts = f.parts
-        return not any(
-            part.startswith(".") or part in ("node_modules", "__pycache__", ".git", "venv", ".venv") for part in parts
-        )
+    for file_path in files:
+        try:
+            yield from _search_file(regex, file_path, prefix)
+        except (OSError, UnicodeDecodeError):
+            # Skip files that can't be read
+            continue
 
-    files = [f for f in files if should_include(f)]
 
-    for file_path in files:
-        if len(results) >= max_results:
-            break
+def _literal_prefix(pattern: str) -> str:
+    """Return a literal string every match of pattern must start with.
 
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-            lines = content.splitlines()
+    Conservative: patterns with alternation get no prefix, and a literal
+    character followed by a quantifier is dropped since it may be absent.
 
-            for line_num, line in enumerate(lines, start=1):
-                if len(results) >= max_results:
-                    break
+    Args:
+        pattern: Case-sensitive regex pattern.
 
-                match = regex.search(line)
+    Returns:
+        The literal prefix, or an empty string if there isn't a usable one.
+    """
+    if "|" in pattern:
+        return ""
+    end = 0
+    while end < len(pattern) and pattern[end] not in _REGEX_METACHARS:
+        end += 1
+    if end < len(pattern) and pattern[end] in "?*+{":
+        end -= 1
+    return pattern[: max(end, 0)]
+
+
+def _read_text_containing(file_path: Path, literal: str) -> str | None:
+    """Read a UTF-8 file as text, or return None if it can't contain literal.
+
+    The literal is looked for in the raw bytes first, so files without it are
+    never decoded. Files over MMAP_THRESHOLD are memory-mapped for that check
+    instead of being read into memory.
+    """
+    # U+FFFD can come from decoding invalid bytes, so the raw check can't rule it out
+    needle = None if "\ufffd" in literal else literal.encode("utf-8")
+
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if needle is not None and mm.find(needle) == -1:
+                    return None
+                data = mm[:]
+        else:
+            data = f.read()
+            if needle is not None and needle not in data:
+                return None
+
+    return data.decode("utf-8", errors="replace")
+
+
+def _search_file(
+    regex: re.Pattern[str],
+    file_path: Path,
+    prefix: str = "",
+) -> Iterator[dict[str, str | int]]:
+    """Yield the matches in one file, line by line.
+
+    With a literal prefix, str.find jumps straight to candidate lines and the
+    regex only runs on those. Otherwise lines are streamed, so a file stops
+    being read as soon as the consumer stops asking. As with ripgrep, lines
+    end only at newlines; form feeds and lone carriage returns don't split them.
+    """
+    # One path string shared by every match in this file
+    file_name = str(file_path)
+
+    if not prefix:
+        with open(file_path, encoding="utf-8", errors="replace", newline="\n") as f:
+            for line_num, line in enumerate(f, start=1):
+                match = regex.search(line.rstrip("\r\n"))
                 if match:
-                    results.append(
-                        {
-                            "file": str(file_path),
-                            "line": line_num,
-                            "content": line,
-                            "match": match.group(0),
-                        }
-                    )
+                    yield {"file": file_name, "line": line_num, "content": match.string, "match": match.group(0)}
+        return
 
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
-            continue
+    content = _read_text_containing(file_path, prefix)
+    if content is None:
+        return
 
-    return results
+    for line_num, line in _lines_containing(content, prefix):
+        match = regex.search(line.rstrip("\r"))
+        if match:
+            yield {"file": file_name, "line": line_num, "content": match.string, "match": match.group(0)}
+
+
+def _lines_containing(content: str, literal: str) -> Iterator[tuple[int, str]]:
+    """Yield (line number, line) for each line of content containing literal.
+
+    str.find jumps from one occurrence to the next, so lines without the
+    literal are never visited. Line numbers are counted incrementally.
+    """
+    line_num = 1
+    counted = 0
+    pos = content.find(literal)
+    while pos != -1:
+        line_start = content.rfind("\n", 0, pos) + 1
+        line_end = content.find("\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+
+        line_num += content.count("\n", counted, line_start)
+        counted = line_start
+
+        yield line_num, content[line_start:line_end]
+        pos = content.find(literal, line_end + 1)
 
 
 @tool(
@@ -190,42 +373,242 @@ async def grep_search(
     return json.dumps({"count": len(results), "results": results}, indent=2)
 
 
-def _should_include_path(path: Path, base_path: Path) -> bool:
-    """Check if a path should be included (not hidden or in common ignore dirs).
+def _compile_name_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a filename glob once, with fnmatch's platform case rules."""
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(pattern), flags)
+
+
+def _match_any_name(name: str) -> bool:
+    """Name test for a bare "*" glob."""
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _make_name_filter(pattern: str) -> Callable[[str], object]:
+    """Build a test for names matching a filename glob; cached per pattern.
+
+    "*" matches every name without a regex and "*.ext" becomes a single
+    str.endswith call; anything else is a compiled fnmatch regex.
+    """
+    if pattern == "*":
+        return _match_any_name
+
+    if not pattern.startswith("*.") or _GLOB_METACHARS.intersection(pattern[1:]):
+        return _compile_name_pattern(pattern).match
+
+    suffix = pattern[1:]
+    if os.path.normcase("A") == "a":
+        # Case-insensitive platform, as fnmatch would be
+        folded = suffix.lower()
+        return lambda name: name.lower().endswith(folded)
+    return lambda name: name.endswith(suffix)
+
+
+def _iter_files(root: Path, name_pattern: str | None = None) -> Iterator[Path]:
+    """Yield files under root depth-first, in directory order.
+
+    Hidden and ignored directories are pruned before they are opened, and
+    symlinked directories are not followed. Entry types come from scandir,
+    so most entries cost no extra stat call.
 
     Args:
-        path: The path to check.
-        base_path: The base directory (to get relative parts).
+        root: Directory to walk.
+        name_pattern: Optional glob matched against each file name.
 
-    Returns:
-        True if the path should be included.
+    Yields:
+        Paths of the files that pass the filters.
     """
-    try:
-        rel_path = path.relative_to(base_path)
-        parts = rel_path.parts
-    except ValueError:
-        parts = path.parts
+    name_match = _make_name_filter(name_pattern) if name_pattern else None
+
+    stack = [str(root)]
+    while stack:
+        files: list[Path] = []
+        subdirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or entry.name in _IGNORED_NAMES:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif (name_match is None or name_match(entry.name)) and entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            # Skip directories that can't be read
+            continue
+
+        yield from files
+        stack.extend(reversed(subdirs))
 
-    return not any(
-        part.startswith(".") or part in ("node_modules", "__pycache__", ".git", "venv", ".venv") for part in parts
-    )
 
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> tuple[tuple[_GlobSegment, ...], bool]:
+    """Lower a Path.glob pattern to per-segment name matchers.
 
-def _get_depth(path: Path, base_path: Path) -> int:
-    """Calculate the depth of a path relative to base.
+    Wildcard segments become name filters from _make_name_filter and other
+    segments literal names. "**" stays a marker that matches any number of
+    directories, as in pathlib. Results are cached per pattern, since the
+    same few patterns are searched again and again.
 
     Args:
-        path: The path to measure.
-        base_path: The base directory.
+        pattern: Glob pattern relative to the search root.
 
     Returns:
-        Number of directory levels from base to path.
+        The compiled segments, and whether only directories can match
+        (the pattern ends with a separator).
+
+    Raises:
+        ValueError: If the pattern is empty.
+        NotImplementedError: If the pattern is absolute.
     """
-    try:
-        rel_path = path.relative_to(base_path)
-        return len(rel_path.parts)
-    except ValueError:
-        return 0
+    if os.path.isabs(pattern):
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    parts = [part for part in pattern.replace(os.sep, "/").split("/") if part and part != "."]
+    if not parts:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+
+    case_sensitive = os.path.normcase("A") == "A"
+    segments: list[_GlobSegment] = []
+    for part in parts:
+        if part == "**":
+            # Consecutive "**" segments match the same paths as one
+            if not segments or segments[-1] is not None:
+                segments.append(None)
+        elif case_sensitive and not _GLOB_METACHARS.intersection(part):
+            segments.append(part)
+        else:
+            segments.append(_make_name_filter(part))
+
+    return tuple(segments), pattern.endswith(("/", os.sep))
+
+
+def _iter_glob(
+    root: str,
+    segments: tuple[_GlobSegment, ...],
+    dirs_only: bool,
+    max_depth: int | None,
+    file_type: str | None,
+) -> Iterator[str]:
+    """Yield paths under root matching compiled glob segments, depth-first by name.
+
+    Each directory is scanned once and carries the set of segment indices
+    still to be matched, so directories that cannot lead to a match are
+    never opened. Hidden and ignored names are pruned, and "**" does not
+    follow symlinked directories (same as pathlib).
+
+    Args:
+        root: Directory to search.
+        segments: Segments from _compile_glob.
+        dirs_only: Whether only directories can match.
+        max_depth: Maximum depth of a match below root.
+        file_type: Filter by type ("file" or "directory").
+
+    Yields:
+        Matching paths relative to root.
+    """
+    last = len(segments)
+    dirs_only = dirs_only or segments[-1] is None
+
+    def expand(states: set[int]) -> frozenset[int]:
+        # "**" may also match zero directories
+        for i in list(states):
+            while i < last and segments[i] is None:
+                i += 1
+                states.add(i)
+        return frozenset(states)
+
+    # Leading literal names are followed with one stat each, without listing
+    # the directories they sit in
+    base, rel_base, depth = root, "", 0
+    while depth < last:
+        name = segments[depth]
+        if not isinstance(name, str):
+            break
+        if name.startswith(".") or name in _IGNORED_NAMES or name == "..":
+            return
+        base = os.path.join(base, name)
+        rel_base = f"{rel_base}{os.sep}{name}" if rel_base else name
+        depth += 1
+        if max_depth is not None and depth > max_depth:
+            return
+        try:
+            mode = os.stat(base).st_mode
+        except OSError:
+            return
+
+        if depth == last:
+            # A pattern without wildcards names a single path
+            is_dir = stat.S_ISDIR(mode)
+            if (
+                (is_dir or not dirs_only)
+                and (file_type != "file" or stat.S_ISREG(mode))
+                and (file_type != "directory" or is_dir)
+            ):
+                yield rel_base
+            return
+        if not stat.S_ISDIR(mode):
+            return
+
+    root_states = expand({depth})
+    if last in root_states and file_type != "file":
+        yield rel_base or "."
+
+    # Nothing below the starting directory can be within max_depth
+    if max_depth is not None and depth >= max_depth:
+        return
+
+    stack = [(base, rel_base, depth, root_states)]
+    while stack:
+        dir_path, rel_dir, depth, states = stack.pop()
+        depth += 1
+        subdirs: list[tuple[str, str, int, frozenset[int]]] = []
+        try:
+            # Name order makes the walk, and so which matches fall under a limit,
+            # the same on every filesystem
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=operator.attrgetter("name"))
+        except OSError:
+            # Skip directories that can't be read
+            continue
+
+        for entry in entries:
+            name = entry.name
+            if name.startswith(".") or name in _IGNORED_NAMES:
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            matched: set[int] = set()
+            for i in states:
+                if i == last:
+                    continue
+                segment = segments[i]
+                if segment is None:
+                    if is_dir and not entry.is_symlink():
+                        matched.add(i)
+                elif name == segment if isinstance(segment, str) else segment(name):
+                    matched.add(i + 1)
+            if not matched:
+                continue
+
+            next_states = expand(matched)
+            rel_path = f"{rel_dir}{os.sep}{name}" if rel_dir else name
+            if (
+                last in next_states
+                and (is_dir or not dirs_only)
+                and (max_depth is None or depth <= max_depth)
+                and (file_type != "file" or entry.is_file())
+                and (file_type != "directory" or is_dir)
+            ):
+                yield rel_path
+            if is_dir and (max_depth is None or depth < max_depth) and min(next_states) < last:
+                subdirs.append((entry.path, rel_path, depth, next_states))
+
+        stack.extend(reversed(subdirs))
 
 
 @tool(
@@ -253,43 +636,17 @@ async def find_files(
         JSON array of matching paths relative to the search path.
     """
     search_path = Path(path)
-    if not search_path.exists():
-        raise FileNotFoundError(f"Path not found: {path}")
-
-    if not search_path.is_dir():
+    if not stat.S_ISDIR(_stat_root(path).st_mode):
         raise NotADirectoryError(f"Path is not a directory: {path}")
 
-    matches: list[str] = []
-    truncated = False
-
-    for item in search_path.glob(pattern):
-        # Check result limit
-        if len(matches) >= MAX_FIND_RESULTS:
-            truncated = True
-            break
-
-        # Skip hidden files and common ignore directories
-        if not _should_include_path(item, search_path):
-            continue
-
-        # Check max_depth
-        if max_depth is not None:
-            depth = _get_depth(item, search_path)
-            if depth > max_depth:
-                continue
+    segments, dirs_only = _compile_glob(pattern)
 
-        # Check file_type filter
-        if file_type == "file" and not item.is_file():
-            continue
-        if file_type == "directory" and not item.is_dir():
-            continue
+    # The walk is blocking work; keep it off the event loop. One extra path tells us if there are more.
+    walk = _iter_glob(str(search_path), segments, dirs_only, max_depth, file_type)
+    matches = await asyncio.to_thread(list, itertools.islice(walk, MAX_FIND_RESULTS + 1))
 
-        # Store relative path for cleaner output
-        try:
-            rel_path = item.relative_to(search_path)
-            matches.append(str(rel_path))
-        except ValueError:
-            matches.append(str(item))
+    truncated = len(matches) > MAX_FIND_RESULTS
+    del matches[MAX_FIND_RESULTS:]
 
     # Sort for consistent output
     matches.sort()
@@ -429,26 +786,77 @@ def _get_language_from_path(file_path: Path) -> str | None:
     return _EXTENSION_TO_LANGUAGE.get(suffix)
 
 
-def _compile_patterns_for_symbol(symbol: str, language: str) -> list[tuple[re.Pattern[str], str]]:
-    """Compile regex patterns for a symbol in a given language.
+@functools.lru_cache(maxsize=256)
+def _compile_definition_matcher(symbol: str, language: str) -> tuple[re.Pattern[str], tuple[str, ...]] | None:
+    """Compile a language's definition patterns for a symbol into one regex.
+
+    Each pattern becomes an alternative wrapped in a named group ``d<index>``.
+    Alternatives are tried in list order, so ``lastgroup`` names the first
+    pattern that matches a line, as a per-pattern loop would. Results are
+    cached, since a search asks for the same (symbol, language) once per file.
 
     Args:
         symbol: The symbol name to search for.
         language: The programming language.
 
     Returns:
-        List of (compiled_pattern, definition_type) tuples.
+        Tuple of (fused pattern, definition type per index), or None if the
+        language has no patterns.
     """
     patterns = _DEFINITION_PATTERNS.get(language, [])
-    compiled = []
+    if not patterns:
+        return None
     escaped_symbol = re.escape(symbol)
-    for pattern_template, def_type in patterns:
-        pattern_str = pattern_template.format(symbol=escaped_symbol)
+    alternatives = [
+        f"(?P<d{index}>{pattern_template.format(symbol=escaped_symbol)})"
+        for index, (pattern_template, _) in enumerate(patterns)
+    ]
+    return re.compile("|".join(alternatives), re.MULTILINE), tuple(def_type for _, def_type in patterns)
+
+
+def _scan_definitions(
+    symbol: str,
+    search_path: Path,
+    single_file: bool,
+    language: str | None,
+) -> list[dict[str, str | int]]:
+    """Find definitions of symbol in the files under search_path, in walk order."""
+    results: list[dict[str, str | int]] = []
+
+    # Collect files to search
+    files = iter([search_path]) if single_file else _iter_files(search_path)
+
+    for file_path in files:
+        # Determine language for this file
+        file_lang = language or _get_language_from_path(file_path)
+        if not file_lang:
+            continue
+
+        # Get the fused patterns for this language
+        matcher = _compile_definition_matcher(symbol, file_lang)
+        if matcher is None:
+            continue
+        regex, def_types = matcher
+
         try:
-            compiled.append((re.compile(pattern_str, re.MULTILINE), def_type))
-        except re.error:
+            content = file_path.read_text(encoding="utf-8", errors="replace")
+        except (OSError, UnicodeDecodeError):
             continue
-    return compiled
+
+        # Every pattern contains the symbol literally, so only those lines can match
+        for line_num, line in _lines_containing(content, symbol):
+            match = regex.match(line)
+            if match and match.lastgroup:
+                results.append(
+                    {
+                        "file": str(file_path),
+                        "line": line_num,
+                        "type": def_types[int(match.lastgroup[1:])],
+                        "context": line.strip(),
+                    }
+                )
+
+    return results
 
 
 @tool(
@@ -475,50 +883,10 @@ async def find_definition(
         JSON array of definition locations with file, line, type, and context.
     """
     search_path = Path(path)
-    if not search_path.exists():
-        raise FileNotFoundError(f"Path not found: {path}")
-
-    results: list[dict[str, str | int]] = []
-
-    # Collect files to search
-    if search_path.is_file():
-        files = [search_path]
-    else:
-        files = [f for f in search_path.rglob("*") if f.is_file()]
-
-    # Filter out hidden and common ignore patterns
-    files = [f for f in files if _should_include_path(f, search_path)]
-
-    for file_path in files:
-        # Determine language for this file
-        file_lang = language or _get_language_from_path(file_path)
-        if not file_lang:
-            continue
-
-        # Get patterns for this language
-        patterns = _compile_patterns_for_symbol(symbol, file_lang)
-        if not patterns:
-            continue
+    single_file = stat.S_ISREG(_stat_root(path).st_mode)
 
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="replace")
-            lines = content.splitlines()
-
-            for line_num, line in enumerate(lines, start=1):
-                for pattern, def_type in patterns:
-                    if pattern.match(line):
-                        results.append(
-                            {
-                                "file": str(file_path),
-                                "line": line_num,
-                                "type": def_type,
-                                "context": line.strip(),
-                            }
-                        )
-                        break  # Only report first matching pattern per line
-
-        except (OSError, UnicodeDecodeError):
-            continue
+    # The walk and file reads are blocking work; keep them off the event loop
+    results = await asyncio.to_thread(_scan_definitions, symbol, search_path, single_file, language)
 
     if not results:
         return json.dumps({"message": f"No definitions found for '{symbol}'", "definitions": []})
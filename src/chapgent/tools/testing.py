@@ -8,6 +8,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
@@ -131,6 +132,50 @@ async def detect_test_framework(project_path: Path) -> TestFramework:
     return TestFramework.UNKNOWN
 
 
+# Individual pytest results from verbose output, e.g. "tests/test_foo.py::test_bar PASSED"
+_PYTEST_RESULT_PATTERN = re.compile(
+    r"^([\w/\\._-]+\.py)::(\S+)\s+(PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?(?:\s+\(([\d.]+)s\))?",
+    re.MULTILINE,
+)
+# Final pytest summary line, e.g. "==== 5 passed, 2 failed, 1 skipped in 1.23s ===="
+_PYTEST_SUMMARY_PATTERN = re.compile(r"=+[^=]+in\s+[\d.]+s\s*=+", re.IGNORECASE)
+# Counts within the summary line; they can appear in any order
+_PYTEST_PASSED_PATTERN = re.compile(r"(\d+)\s+passed", re.IGNORECASE)
+_PYTEST_FAILED_PATTERN = re.compile(r"(\d+)\s+failed", re.IGNORECASE)
+_PYTEST_SKIPPED_PATTERN = re.compile(r"(\d+)\s+skipped", re.IGNORECASE)
+_PYTEST_ERRORS_PATTERN = re.compile(r"(\d+)\s+errors?", re.IGNORECASE)
+_PYTEST_DURATION_PATTERN = re.compile(r"in\s+([\d.]+)s", re.IGNORECASE)
+# Failure sections, e.g. "____ test_name ____" followed by the traceback
+_PYTEST_FAILURE_PATTERN = re.compile(
+    r"_{3,}\s+(\S+)\s+_{3,}\s*([\s\S]*?)(?=_{3,}|={3,}|$)",
+    re.MULTILINE,
+)
+
+
+def _find_pytest_summary(output: str) -> str | None:
+    """Find pytest's final summary line, scanning lines from the end.
+
+    The summary closes the run, so this usually stops after a line or two,
+    and "== ... in 1s ==" text printed earlier by the tests themselves is
+    never mistaken for it.
+
+    Args:
+        output: Raw pytest output.
+
+    Returns:
+        The matched summary text, or None if there isn't one.
+    """
+    end = len(output)
+    while end >= 0:
+        start = output.rfind("\n", 0, end) + 1
+        if "=" in output[start:end]:
+            match = _PYTEST_SUMMARY_PATTERN.search(output, start, end)
+            if match:
+                return match.group(0)
+        end = start - 1
+    return None
+
+
 def _parse_pytest_output(output: str) -> TestSummary:
     """Parse pytest output into TestSummary.
 
@@ -144,13 +189,7 @@ def _parse_pytest_output(output: str) -> TestSummary:
     results: list[TestResult] = []
 
     # Parse individual test results from verbose output
-    # Matches patterns like: tests/test_foo.py::test_bar PASSED
-    test_pattern = re.compile(
-        r"^([\w/\\._-]+\.py)::(\S+)\s+(PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?(?:\s+\(([\d.]+)s\))?",
-        re.MULTILINE,
-    )
-
-    for match in test_pattern.finditer(output):
+    for match in _PYTEST_RESULT_PATTERN.finditer(output):
         file_path = match.group(1)
         test_name = match.group(2)
         status_str = match.group(3).lower()
@@ -178,18 +217,15 @@ def _parse_pytest_output(output: str) -> TestSummary:
         )
 
     # Parse summary line: "5 passed, 2 failed, 1 skipped in 1.23s"
-    # The counts can appear in any order, so we use individual patterns
-    summary_line_pattern = re.compile(r"=+[^=]+in\s+[\d.]+s\s*=+", re.IGNORECASE)
-    summary_match = summary_line_pattern.search(output)
+    summary_text = _find_pytest_summary(output)
 
-    if summary_match:
-        summary_text = summary_match.group(0)
+    if summary_text is not None:
         # Extract individual counts
-        passed_match = re.search(r"(\d+)\s+passed", summary_text, re.IGNORECASE)
-        failed_match = re.search(r"(\d+)\s+failed", summary_text, re.IGNORECASE)
-        skipped_match = re.search(r"(\d+)\s+skipped", summary_text, re.IGNORECASE)
-        errors_match = re.search(r"(\d+)\s+errors?", summary_text, re.IGNORECASE)
-        duration_match = re.search(r"in\s+([\d.]+)s", summary_text, re.IGNORECASE)
+        passed_match = _PYTEST_PASSED_PATTERN.search(summary_text)
+        failed_match = _PYTEST_FAILED_PATTERN.search(summary_text)
+        skipped_match = _PYTEST_SKIPPED_PATTERN.search(summary_text)
+        errors_match = _PYTEST_ERRORS_PATTERN.search(summary_text)
+        duration_match = _PYTEST_DURATION_PATTERN.search(summary_text)
 
         summary.passed = int(passed_match.group(1)) if passed_match else 0
         summary.failed = int(failed_match.group(1)) if failed_match else 0
@@ -207,11 +243,7 @@ def _parse_pytest_output(output: str) -> TestSummary:
     summary.results = results
 
     # Extract failure messages
-    failure_pattern = re.compile(
-        r"_{3,}\s+(\S+)\s+_{3,}\s*([\s\S]*?)(?=_{3,}|={3,}|$)",
-        re.MULTILINE,
-    )
-    failures = {m.group(1): m.group(2).strip() for m in failure_pattern.finditer(output)}
+    failures = {m.group(1): m.group(2).strip() for m in _PYTEST_FAILURE_PATTERN.finditer(output)}
 
     for result in summary.results:
         if result.status == "failed" and result.name in failures:
@@ -220,6 +252,19 @@ def _parse_pytest_output(output: str) -> TestSummary:
     return summary
 
 
+# Individual Jest results, e.g. "✓ test name (123 ms)" or "✕ test name (123 ms)"
+_JEST_RESULT_PATTERN = re.compile(
+    r"^\s*(✓|✕|○|PASS|FAIL|SKIP)\s+(.+?)(?:\s+\((\d+)\s*m?s\))?$",
+    re.MULTILINE,
+)
+# Jest summary line, e.g. "Tests: 2 failed, 1 skipped, 5 passed, 8 total"
+_JEST_SUMMARY_PATTERN = re.compile(
+    r"Tests?:\s*(?:(\d+)\s+failed,?\s*)?(?:(\d+)\s+skipped,?\s*)?" r"(?:(\d+)\s+passed,?\s*)?(?:(\d+)\s+total)?",
+    re.IGNORECASE,
+)
+_JEST_TIME_PATTERN = re.compile(r"Time:\s+([\d.]+)\s*s", re.IGNORECASE)
+
+
 def _parse_jest_output(output: str) -> TestSummary:
     """Parse Jest output into TestSummary.
 
@@ -233,13 +278,7 @@ def _parse_jest_output(output: str) -> TestSummary:
     results: list[TestResult] = []
 
     # Parse individual test results
-    # Matches: ✓ test name (123 ms) or ✕ test name (123 ms)
-    test_pattern = re.compile(
-        r"^\s*(✓|✕|○|PASS|FAIL|SKIP)\s+(.+?)(?:\s+\((\d+)\s*m?s\))?$",
-        re.MULTILINE,
-    )
-
-    for match in test_pattern.finditer(output):
+    for match in _JEST_RESULT_PATTERN.finditer(output):
         status_char = match.group(1)
         test_name = match.group(2).strip()
         duration_str = match.group(3)
@@ -263,12 +302,7 @@ def _parse_jest_output(output: str) -> TestSummary:
         )
 
     # Parse summary line: "Tests: 2 failed, 1 skipped, 5 passed, 8 total"
-    summary_pattern = re.compile(
-        r"Tests?:\s*(?:(\d+)\s+failed,?\s*)?(?:(\d+)\s+skipped,?\s*)?" r"(?:(\d+)\s+passed,?\s*)?(?:(\d+)\s+total)?",
-        re.IGNORECASE,
-    )
-
-    summary_match = summary_pattern.search(output)
+    summary_match = _JEST_SUMMARY_PATTERN.search(output)
     if summary_match:
         summary.failed = int(summary_match.group(1) or 0)
         summary.skipped = int(summary_match.group(2) or 0)
@@ -281,8 +315,7 @@ def _parse_jest_output(output: str) -> TestSummary:
         summary.total = len(results)
 
     # Parse time
-    time_pattern = re.compile(r"Time:\s+([\d.]+)\s*s", re.IGNORECASE)
-    time_match = time_pattern.search(output)
+    time_match = _JEST_TIME_PATTERN.search(output)
     if time_match:
         summary.duration = float(time_match.group(1))
 
@@ -290,6 +323,18 @@ def _parse_jest_output(output: str) -> TestSummary:
     return summary
 
 
+# Individual go test results, e.g. "--- PASS: TestName (0.00s)"
+_GO_RESULT_PATTERN = re.compile(
+    r"---\s+(PASS|FAIL|SKIP):\s+(\S+)\s+\(([\d.]+)s\)",
+    re.MULTILINE,
+)
+# Started tests, e.g. "=== RUN   TestName"
+_GO_RUN_PATTERN = re.compile(r"===\s+RUN\s+(\S+)")
+# Package result lines with the duration, e.g. "ok  example.com/pkg 0.01s"
+_GO_OK_PATTERN = re.compile(r"^ok\s+\S+\s+([\d.]+)s", re.MULTILINE)
+_GO_FAIL_PATTERN = re.compile(r"^FAIL\s+\S+\s+([\d.]+)s", re.MULTILINE)
+
+
 def _parse_go_test_output(output: str) -> TestSummary:
     """Parse go test output into TestSummary.
 
@@ -303,13 +348,7 @@ def _parse_go_test_output(output: str) -> TestSummary:
     results: list[TestResult] = []
 
     # Parse individual test results
-    # Matches: --- PASS: TestName (0.00s) or --- FAIL: TestName (0.00s)
-    test_pattern = re.compile(
-        r"---\s+(PASS|FAIL|SKIP):\s+(\S+)\s+\(([\d.]+)s\)",
-        re.MULTILINE,
-    )
-
-    for match in test_pattern.finditer(output):
+    for match in _GO_RESULT_PATTERN.finditer(output):
         status_str = match.group(1)
         test_name = match.group(2)
         duration_str = match.group(3)
@@ -331,10 +370,9 @@ def _parse_go_test_output(output: str) -> TestSummary:
         )
 
     # Also match RUN lines for tests that might not have a result yet
-    run_pattern = re.compile(r"===\s+RUN\s+(\S+)")
     completed_tests = {r.name for r in results}
 
-    for match in run_pattern.finditer(output):
+    for match in _GO_RUN_PATTERN.finditer(output):
         test_name = match.group(1)
         if test_name not in completed_tests:
             # Test started but no result - might have errored
@@ -346,11 +384,8 @@ def _parse_go_test_output(output: str) -> TestSummary:
             )
 
     # Parse overall result: ok or FAIL with package name and duration
-    ok_pattern = re.compile(r"^ok\s+\S+\s+([\d.]+)s", re.MULTILINE)
-    fail_pattern = re.compile(r"^FAIL\s+\S+\s+([\d.]+)s", re.MULTILINE)
-
-    ok_match = ok_pattern.search(output)
-    fail_match = fail_pattern.search(output)
+    ok_match = _GO_OK_PATTERN.search(output)
+    fail_match = _GO_FAIL_PATTERN.search(output)
 
     if ok_match:
         summary.duration = float(ok_match.group(1))
@@ -367,6 +402,19 @@ def _parse_go_test_output(output: str) -> TestSummary:
     return summary
 
 
+# Individual cargo test results, e.g. "test module::test_name ... ok" (or FAILED, ignored)
+_CARGO_RESULT_PATTERN = re.compile(
+    r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)",
+    re.MULTILINE,
+)
+# Summary line, e.g. "test result: ok. 5 passed; 0 failed; 1 ignored; 0 measured"
+_CARGO_SUMMARY_PATTERN = re.compile(
+    r"test result:\s+\w+\.\s+(\d+)\s+passed;\s+(\d+)\s+failed;\s+(\d+)\s+ignored",
+    re.IGNORECASE,
+)
+_CARGO_TIME_PATTERN = re.compile(r"finished in ([\d.]+)s", re.IGNORECASE)
+
+
 def _parse_cargo_test_output(output: str) -> TestSummary:
     """Parse cargo test output into TestSummary.
 
@@ -380,13 +428,7 @@ def _parse_cargo_test_output(output: str) -> TestSummary:
     results: list[TestResult] = []
 
     # Parse individual test results
-    # Matches: test module::test_name ... ok (or FAILED, ignored)
-    test_pattern = re.compile(
-        r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)",
-        re.MULTILINE,
-    )
-
-    for match in test_pattern.finditer(output):
+    for match in _CARGO_RESULT_PATTERN.finditer(output):
         test_name = match.group(1)
         status_str = match.group(2)
 
@@ -406,12 +448,7 @@ def _parse_cargo_test_output(output: str) -> TestSummary:
         )
 
     # Parse summary line: "test result: ok. 5 passed; 0 failed; 1 ignored; 0 measured"
-    summary_pattern = re.compile(
-        r"test result:\s+\w+\.\s+(\d+)\s+passed;\s+(\d+)\s+failed;\s+(\d+)\s+ignored",
-        re.IGNORECASE,
-    )
-
-    summary_match = summary_pattern.search(output)
+    summary_match = _CARGO_SUMMARY_PATTERN.search(output)
     if summary_match:
         summary.passed = int(summary_match.group(1))
         summary.failed = int(summary_match.group(2))
@@ -425,14 +462,27 @@ def _parse_cargo_test_output(output: str) -> TestSummary:
     summary.results = results
 
     # Parse duration from "finished in X.XXs"
-    time_pattern = re.compile(r"finished in ([\d.]+)s", re.IGNORECASE)
-    time_match = time_pattern.search(output)
+    time_match = _CARGO_TIME_PATTERN.search(output)
     if time_match:
         summary.duration = float(time_match.group(1))
 
     return summary
 
 
+# Individual unittest results from verbose output, e.g. "test_name (module.TestClass) ... ok"
+_UNITTEST_RESULT_PATTERN = re.compile(
+    r"^(\w+)\s+\(([^)]+)\)\s+\.\.\.\s+(ok|FAIL|ERROR|skipped)",
+    re.MULTILINE,
+)
+# Summary lines: "Ran X tests in Y.YYYs", then "OK" or "FAILED (failures=N, errors=M)"
+_UNITTEST_RAN_PATTERN = re.compile(r"Ran\s+(\d+)\s+tests?\s+in\s+([\d.]+)s", re.IGNORECASE)
+_UNITTEST_FAILED_PATTERN = re.compile(
+    r"FAILED\s*\((?:failures=(\d+))?[,\s]*(?:errors=(\d+))?[,\s]*(?:skipped=(\d+))?\)",
+    re.IGNORECASE,
+)
+_UNITTEST_OK_SKIPPED_PATTERN = re.compile(r"OK\s*\(skipped=(\d+)\)")
+
+
 def _parse_unittest_output(output: str) -> TestSummary:
     """Parse unittest output into TestSummary.
 
@@ -446,13 +496,7 @@ def _parse_unittest_output(output: str) -> TestSummary:
     results: list[TestResult] = []
 
     # Parse individual test results from verbose output
-    # Matches: test_name (module.TestClass) ... ok
-    test_pattern = re.compile(
-        r"^(\w+)\s+\(([^)]+)\)\s+\.\.\.\s+(ok|FAIL|ERROR|skipped)",
-        re.MULTILINE,
-    )
-
-    for match in test_pattern.finditer(output):
+    for match in _UNITTEST_RESULT_PATTERN.finditer(output):
         test_name = match.group(1)
         module = match.group(2)
         status_str = match.group(3)
@@ -475,17 +519,12 @@ def _parse_unittest_output(output: str) -> TestSummary:
         )
 
     # Parse summary: "Ran X tests in Y.YYYs" and "OK" or "FAILED (failures=N, errors=M)"
-    ran_pattern = re.compile(r"Ran\s+(\d+)\s+tests?\s+in\s+([\d.]+)s", re.IGNORECASE)
-    ran_match = ran_pattern.search(output)
+    ran_match = _UNITTEST_RAN_PATTERN.search(output)
     if ran_match:
         summary.total = int(ran_match.group(1))
         summary.duration = float(ran_match.group(2))
 
-    fail_pattern = re.compile(
-        r"FAILED\s*\((?:failures=(\d+))?[,\s]*(?:errors=(\d+))?[,\s]*(?:skipped=(\d+))?\)",
-        re.IGNORECASE,
-    )
-    fail_match = fail_pattern.search(output)
+    fail_match = _UNITTEST_FAILED_PATTERN.search(output)
     if fail_match:
         summary.failed = int(fail_match.group(1) or 0)
         summary.errors = int(fail_match.group(2) or 0)
@@ -493,7 +532,7 @@ def _parse_unittest_output(output: str) -> TestSummary:
         summary.passed = summary.total - summary.failed - summary.errors - summary.skipped
     elif "OK" in output:
         # All tests passed
-        skip_match = re.search(r"OK\s*\(skipped=(\d+)\)", output)
+        skip_match = _UNITTEST_OK_SKIPPED_PATTERN.search(output)
         if skip_match:
             summary.skipped = int(skip_match.group(1))
         summary.passed = summary.total - summary.skipped
@@ -507,6 +546,17 @@ def _parse_unittest_output(output: str) -> TestSummary:
     return summary
 
 
+# Output parser for each framework whose output we understand
+_OUTPUT_PARSERS: dict[TestFramework, Callable[[str], TestSummary]] = {
+    TestFramework.PYTEST: _parse_pytest_output,
+    TestFramework.JEST: _parse_jest_output,
+    TestFramework.VITEST: _parse_jest_output,
+    TestFramework.GO_TEST: _parse_go_test_output,
+    TestFramework.CARGO_TEST: _parse_cargo_test_output,
+    TestFramework.UNITTEST: _parse_unittest_output,
+}
+
+
 async def parse_test_output(output: str, framework: TestFramework) -> TestSummary:
     """Parse test runner output into structured results.
 
@@ -517,19 +567,11 @@ async def parse_test_output(output: str, framework: TestFramework) -> TestSummar
     Returns:
         Parsed TestSummary with individual results.
     """
-    if framework == TestFramework.PYTEST:
-        return _parse_pytest_output(output)
-    elif framework == TestFramework.JEST or framework == TestFramework.VITEST:
-        return _parse_jest_output(output)
-    elif framework == TestFramework.GO_TEST:
-        return _parse_go_test_output(output)
-    elif framework == TestFramework.CARGO_TEST:
-        return _parse_cargo_test_output(output)
-    elif framework == TestFramework.UNITTEST:
-        return _parse_unittest_output(output)
-    else:
+    parser = _OUTPUT_PARSERS.get(framework)
+    if parser is None:
         # Return raw output with no parsing
         return TestSummary(raw_output=output)
+    return parser(output)
 
 
 def _build_test_command(
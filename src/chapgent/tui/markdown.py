@@ -11,6 +11,7 @@ Features:
 - Role-based message styling (user vs agent)
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from rich.markdown import Markdown as RichMarkdown
@@ -172,6 +173,7 @@ class MarkdownMessage(Static):
         *,
         role: str = "agent",
         renderer: MarkdownRenderer | None = None,
+        on_selection_change: Callable[["MarkdownMessage", bool], None] | None = None,
         name: str | None = None,
         id: str | None = None,
         classes: str | None = None,
@@ -182,6 +184,8 @@ class MarkdownMessage(Static):
             content: The markdown content to render.
             role: Message role ("user" or "agent"). Affects styling.
             renderer: Markdown renderer to use. Uses default if None.
+            on_selection_change: Called with the message and its new state
+                whenever the selection state changes.
             name: Widget name.
             id: Widget ID.
             classes: Additional CSS classes.
@@ -197,6 +201,7 @@ class MarkdownMessage(Static):
         self._role = role
         self._renderer = renderer or MarkdownRenderer()
         self._selected = False
+        self._on_selection_change = on_selection_change
 
         # Initialize Static with rendered content
         super().__init__(self._render_markdown(), name=name, id=id, classes=classes)
@@ -256,11 +261,15 @@ class MarkdownMessage(Static):
         Args:
             value: True to select, False to deselect.
         """
+        if value == self._selected:
+            return
         self._selected = value
         if value:
             self.add_class("selected")
         else:
             self.remove_class("selected")
+        if self._on_selection_change is not None:
+            self._on_selection_change(self, value)
 
     def on_click(self, event: Click) -> None:
         """Handle click events to toggle selection.
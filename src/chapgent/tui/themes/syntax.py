@@ -8,23 +8,31 @@ The mappings ensure that code blocks use colors that work well with the
 overall application theme (dark themes get dark syntax themes, etc.).
 """
 
+import re
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
 # Mapping from Textual theme to Pygments theme
-# These mappings provide complementary syntax highlighting colors
-THEME_MAPPING: dict[str, str] = {
-    # Dark themes
-    "textual-dark": "monokai",
-    "textual-ansi": "native",
-    "nord": "nord",
-    "gruvbox": "gruvbox-dark",
-    "dracula": "dracula",
-    "monokai": "monokai",
-    "solarized-dark": "solarized-dark",
-    "tokyo-night": "monokai",  # No exact match, monokai is a good dark fallback
-    "rose-pine": "monokai",  # No exact match, monokai is a good dark fallback
-    # Light themes
-    "textual-light": "friendly",
-    "solarized-light": "solarized-light",
-}
+# These mappings provide complementary syntax highlighting colors. The mapping
+# is read-only so the cached lookups below can never go stale.
+THEME_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        # Dark themes
+        "textual-dark": "monokai",
+        "textual-ansi": "native",
+        "nord": "nord",
+        "gruvbox": "gruvbox-dark",
+        "dracula": "dracula",
+        "monokai": "monokai",
+        "solarized-dark": "solarized-dark",
+        "tokyo-night": "monokai",  # No exact match, monokai is a good dark fallback
+        "rose-pine": "monokai",  # No exact match, monokai is a good dark fallback
+        # Light themes
+        "textual-light": "friendly",
+        "solarized-light": "solarized-light",
+    }
+)
 
 # Default fallback themes when no mapping exists
 DEFAULT_DARK_THEME = "monokai"
@@ -38,7 +46,11 @@ LIGHT_THEME_INDICATORS = frozenset(
     }
 )
 
+# Matches any light indicator case-insensitively, without lowercasing the name
+_LIGHT_THEME_PATTERN = re.compile("|".join(map(re.escape, sorted(LIGHT_THEME_INDICATORS))), re.IGNORECASE)
+
 
+@lru_cache(maxsize=128)
 def get_syntax_theme(textual_theme: str) -> str:
     """Get the Pygments theme for a Textual theme.
 
@@ -70,6 +82,7 @@ def get_syntax_theme(textual_theme: str) -> str:
     return DEFAULT_LIGHT_THEME
 
 
+@lru_cache(maxsize=128)
 def is_dark_theme(textual_theme: str) -> bool:
     """Check if a Textual theme is a dark theme.
 
@@ -93,5 +106,4 @@ def is_dark_theme(textual_theme: str) -> bool:
         >>> is_dark_theme("nord")
         True
     """
-    theme_lower = textual_theme.lower()
-    return not any(indicator in theme_lower for indicator in LIGHT_THEME_INDICATORS)
+    return _LIGHT_THEME_PATTERN.search(textual_theme) is None
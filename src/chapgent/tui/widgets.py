@@ -4,8 +4,10 @@ from enum import Enum
 from typing import Any
 
 from textual.app import ComposeResult
+from textual.await_remove import AwaitRemove
 from textual.containers import Horizontal, VerticalScroll
 from textual.screen import ModalScreen
+from textual.widget import AwaitMount
 from textual.widgets import Button, Input, Pretty, Static
 
 from .markdown import MarkdownConfig, MarkdownMessage, MarkdownRenderer
@@ -203,6 +205,8 @@ class ConversationPanel(Static):
         self._renderer: MarkdownRenderer | None = None
         self._streaming_message_id: str | None = None  # Track current streaming message ID
         self._streaming_counter: int = 0  # Counter for unique IDs
+        self._messages: dict[MarkdownMessage, int] = {}  # Appended messages -> position
+        self._selected: set[MarkdownMessage] = set()
 
     def _get_renderer(self) -> MarkdownRenderer:
         """Get or create the markdown renderer with current theme.
@@ -230,35 +234,49 @@ class ConversationPanel(Static):
     def compose(self) -> ComposeResult:
         yield VerticalScroll(id="conversation-messages")
 
-    def append_user_message(self, content: str) -> None:
+    def append_user_message(self, content: str) -> AwaitMount:
         """Append a user message to the conversation.
 
         Args:
             content: The message content (markdown supported).
+
+        Returns:
+            An awaitable that completes once the message is mounted.
+            Awaiting it is optional.
         """
         scroll = self.query_one("#conversation-messages", VerticalScroll)
         message = MarkdownMessage(
             content,
             role="user",
             renderer=self._get_renderer(),
+            on_selection_change=self._on_selection_change,
         )
-        scroll.mount(message)
+        await_mount = scroll.mount(message)
+        self._messages[message] = len(self._messages)
         scroll.scroll_end(animate=False)
+        return await_mount
 
-    def append_assistant_message(self, content: str) -> None:
+    def append_assistant_message(self, content: str) -> AwaitMount:
         """Append an assistant message to the conversation.
 
         Args:
             content: The message content (markdown supported).
+
+        Returns:
+            An awaitable that completes once the message is mounted.
+            Awaiting it is optional.
         """
         scroll = self.query_one("#conversation-messages", VerticalScroll)
         message = MarkdownMessage(
             content,
             role="agent",
             renderer=self._get_renderer(),
+            on_selection_change=self._on_selection_change,
         )
-        scroll.mount(message)
+        await_mount = scroll.mount(message)
+        self._messages[message] = len(self._messages)
         scroll.scroll_end(animate=False)
+        return await_mount
 
     def append_streaming_message(self) -> MarkdownMessage:
         """Append an empty assistant message for streaming updates.
@@ -279,9 +297,11 @@ class ConversationPanel(Static):
             "_Thinking..._",  # Placeholder while waiting for response
             role="agent",
             renderer=self._get_renderer(),
+            on_selection_change=self._on_selection_change,
             id=self._streaming_message_id,
         )
         scroll.mount(message)
+        self._messages[message] = len(self._messages)
         scroll.scroll_end(animate=False)
         return message
 
@@ -318,10 +338,17 @@ class ConversationPanel(Static):
         """
         self._renderer = None
 
-    def clear(self) -> None:
-        """Clear the conversation history."""
+    def clear(self) -> AwaitRemove:
+        """Clear the conversation history.
+
+        Returns:
+            An awaitable that completes once the messages are removed.
+            Awaiting it is optional.
+        """
         scroll = self.query_one("#conversation-messages", VerticalScroll)
-        scroll.query("*").remove()
+        self._messages.clear()
+        self._selected.clear()
+        return scroll.query("*").remove()
 
     def get_selected_messages(self) -> list[MarkdownMessage]:
         """Get all selected messages in order.
@@ -329,9 +356,7 @@ class ConversationPanel(Static):
         Returns:
             List of selected MarkdownMessage widgets.
         """
-        scroll = self.query_one("#conversation-messages", VerticalScroll)
-        messages = list(scroll.query(MarkdownMessage))
-        return [msg for msg in messages if msg.selected]
+        return sorted(self._selected, key=self._messages.__getitem__)
 
     def get_selected_content(self) -> str:
         """Get the content of all selected messages.
@@ -350,16 +375,23 @@ class ConversationPanel(Static):
 
         return "\n\n".join(parts)
 
+    def _on_selection_change(self, message: MarkdownMessage, selected: bool) -> None:
+        """Keep the selected set in step with a message's selection state."""
+        if message not in self._messages:
+            return  # Already cleared from the conversation
+        if selected:
+            self._selected.add(message)
+        else:
+            self._selected.discard(message)
+
     def clear_selection(self) -> None:
         """Deselect all messages."""
-        scroll = self.query_one("#conversation-messages", VerticalScroll)
-        for msg in scroll.query(MarkdownMessage):
+        for msg in list(self._selected):
             msg.selected = False
 
     def select_all(self) -> None:
         """Select all messages."""
-        scroll = self.query_one("#conversation-messages", VerticalScroll)
-        for msg in scroll.query(MarkdownMessage):
+        for msg in self._messages:
             msg.selected = True
 
 
@@ -1,4 +1,13 @@
+import os
+
 import pytest
+from hypothesis import settings
+
+# Hypothesis profiles. "ci" is the default; set HYPOTHESIS_PROFILE=dev for
+# Hypothesis' own defaults (more examples, random seeds, example database).
+settings.register_profile("ci", max_examples=10, deadline=None, derandomize=True, database=None)
+settings.register_profile("dev")
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
 
 
 @pytest.fixture
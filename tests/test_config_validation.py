@@ -315,14 +315,14 @@ class TestSettingsValidation:
 class TestPropertyBased:
     """Property-based tests using hypothesis."""
 
-    @given(st.sampled_from(list(VALID_PROVIDERS)))
+    @given(st.sampled_from(sorted(VALID_PROVIDERS)))
     @hypothesis_settings(max_examples=20)
     def test_all_valid_providers_accepted(self, provider: str):
         """All valid providers should be accepted."""
         settings = LLMSettings(provider=provider)
         assert settings.provider == provider.lower()
 
-    @given(st.sampled_from(list(VALID_THEMES)))
+    @given(st.sampled_from(sorted(VALID_THEMES)))
     @hypothesis_settings(max_examples=20)
     def test_all_valid_themes_accepted(self, theme: str):
         """All valid themes should be accepted."""
@@ -1,8 +1,11 @@
 """Tests for context models."""
 
+from pathlib import Path
+
 import pytest
-from hypothesis import given, settings
+from hypothesis import given
 from hypothesis import strategies as st
+from pydantic import BaseModel
 
 from chapgent.context.models import (
     GitInfo,
@@ -11,6 +14,12 @@ from chapgent.context.models import (
     TestFramework,
 )
 
+
+def assert_round_trip(model: BaseModel) -> None:
+    """Assert a model survives a JSON round trip unchanged."""
+    assert type(model).model_validate_json(model.model_dump_json()) == model
+
+
 # Enum tests (consolidated)
 
 
@@ -55,7 +64,7 @@ class TestGitInfo:
 
     def test_defaults_and_explicit_values(self):
         """Test GitInfo with defaults and explicit values."""
-        default = GitInfo()
+        default = GitInfo.model_construct()
         assert (default.branch, default.remote, default.has_changes, default.commit_count, default.last_commit) == (
             None,
             None,
@@ -63,7 +72,7 @@ class TestGitInfo:
             0,
             None,
         )
-        explicit = GitInfo(
+        explicit = GitInfo.model_construct(
             branch="main",
             remote="https://github.com/user/repo.git",
             has_changes=True,
@@ -80,10 +89,7 @@ class TestGitInfo:
 
     def test_serialization_roundtrip(self):
         """Test GitInfo JSON serialization roundtrip."""
-        info = GitInfo(branch="main", has_changes=True)
-        data = info.model_dump()
-        info2 = GitInfo.model_validate(data)
-        assert (info2.branch, info2.has_changes) == ("main", True)
+        assert_round_trip(GitInfo(branch="main", has_changes=True))
 
 
 # ProjectContext model tests
@@ -91,7 +97,7 @@ class TestGitInfo:
 
 def test_project_context_defaults():
     """Test ProjectContext default values."""
-    ctx = ProjectContext()
+    ctx = ProjectContext.model_construct()
     assert ctx.type == ProjectType.UNKNOWN
     assert ctx.root == "."
     assert ctx.name is None
@@ -105,7 +111,8 @@ def test_project_context_defaults():
 
 def test_project_context_with_values():
     """Test ProjectContext with explicit values."""
-    ctx = ProjectContext(
+    # Validation is not under test here, so skip it.
+    ctx = ProjectContext.model_construct(
         type=ProjectType.PYTHON,
         root="/home/user/project",
         name="myproject",
@@ -113,7 +120,7 @@ def test_project_context_with_values():
         dependencies=["requests", "pytest"],
         scripts={"test": "pytest", "lint": "ruff check"},
         test_framework=TestFramework.PYTEST,
-        git_info=GitInfo(branch="main"),
+        git_info=GitInfo.model_construct(branch="main"),
         config_files=["pyproject.toml", "setup.cfg"],
     )
     assert ctx.type == ProjectType.PYTHON
@@ -146,6 +153,16 @@ def test_project_context_root_path_property():
     assert path.is_absolute()
 
 
+def test_project_context_root_path_follows_root():
+    """root_path reflects root after it is reassigned or copied with an update."""
+    ctx = ProjectContext(root="/a")
+    assert ctx.root_path == Path("/a")
+
+    ctx.root = "/b"
+    assert ctx.root_path == Path("/b")
+    assert ctx.model_copy(update={"root": "/c"}).root_path == Path("/c")
+
+
 def test_project_context_serialization():
     """Test ProjectContext JSON serialization."""
     ctx = ProjectContext(
@@ -155,17 +172,7 @@ def test_project_context_serialization():
         dependencies=["express"],
         git_info=GitInfo(branch="develop"),
     )
-    data = ctx.model_dump()
-    assert data["type"] == "node"
-    assert data["root"] == "/app"
-    assert data["name"] == "webapp"
-    assert data["git_info"]["branch"] == "develop"
-
-    # Can reconstruct from dict
-    ctx2 = ProjectContext.model_validate(data)
-    assert ctx2.type == ProjectType.NODE
-    assert ctx2.git_info is not None
-    assert ctx2.git_info.branch == "develop"
+    assert_round_trip(ctx)
 
 
 def test_project_context_json_round_trip():
@@ -177,14 +184,7 @@ def test_project_context_json_round_trip():
         version="0.1.0",
         test_framework=TestFramework.CARGO_TEST,
     )
-    json_str = ctx.model_dump_json()
-    ctx2 = ProjectContext.model_validate_json(json_str)
-
-    assert ctx2.type == ctx.type
-    assert ctx2.root == ctx.root
-    assert ctx2.name == ctx.name
-    assert ctx2.version == ctx.version
-    assert ctx2.test_framework == ctx.test_framework
+    assert_round_trip(ctx)
 
 
 # Property-based tests
@@ -192,9 +192,10 @@ def test_project_context_json_round_trip():
 
 @given(
     name=st.text(min_size=1, max_size=50).filter(lambda x: x.strip()),
-    version=st.from_regex(r"[0-9]+\.[0-9]+\.[0-9]+", fullmatch=True),
+    version=st.tuples(st.integers(0, 999), st.integers(0, 999), st.integers(0, 999)).map(
+        lambda t: f"{t[0]}.{t[1]}.{t[2]}"
+    ),
 )
-@settings(max_examples=20)
 def test_project_context_properties(name: str, version: str):
     """Property test for ProjectContext serialization."""
     ctx = ProjectContext(
@@ -202,21 +203,14 @@ def test_project_context_properties(name: str, version: str):
         name=name.strip(),
         version=version,
     )
-    data = ctx.model_dump()
-    ctx2 = ProjectContext.model_validate(data)
-    assert ctx2.name == ctx.name
-    assert ctx2.version == ctx.version
+    assert_round_trip(ctx)
 
 
 @given(
     branch=st.text(min_size=1, max_size=30).filter(lambda x: x.strip()),
     commit_count=st.integers(min_value=0, max_value=100000),
 )
-@settings(max_examples=20)
 def test_git_info_properties(branch: str, commit_count: int):
     """Property test for GitInfo serialization."""
     info = GitInfo(branch=branch.strip(), commit_count=commit_count)
-    data = info.model_dump()
-    info2 = GitInfo.model_validate(data)
-    assert info2.branch == info.branch
-    assert info2.commit_count == info.commit_count
+    assert_round_trip(info)
@@ -14,7 +14,9 @@ from chapgent.core.cache import (
     CacheEntry,
     CacheStats,
     ToolCache,
+    canonical_args,
 )
+from chapgent.core.parallel import call_key
 
 
 class TestCacheDataclasses:
@@ -298,6 +300,12 @@ class TestToolCacheKeyGenerationAndTTL:
             "read_file", {"path": "/b.txt"}
         )
 
+    def test_batch_dedup_key_uses_cache_canonical_form(self, cache: ToolCache) -> None:
+        """Test the parallel executor's call key and the cache key share one encoding."""
+        args1, args2 = {"b": [1, 2], "a": {"y": 1, "x": 2}}, {"a": {"x": 2, "y": 1}, "b": [1, 2]}
+        assert call_key("read_file", args1) == call_key("read_file", args2) == f"read_file:{canonical_args(args1)}"
+        assert cache._generate_key("read_file", args1) == cache._generate_key("read_file", args2)
+
     def test_ttl_handling(self, cache: ToolCache) -> None:
         """Test TTL uses default for unknown tools, configured for known."""
         assert cache._get_ttl("unknown_tool") == 60
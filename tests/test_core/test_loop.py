@@ -9,6 +9,9 @@ Tests verify user-facing behavior:
 """
 
 import json
+import os
+import uuid
+from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -16,7 +19,8 @@ import pytest
 from chapgent.core.agent import Agent
 from chapgent.core.cancellation import CancellationToken
 from chapgent.core.loop import DEFAULT_MAX_ITERATIONS, conversation_loop, streaming_conversation_loop
-from chapgent.core.providers import LLMResponse, TokenUsage
+from chapgent.core.permissions import PermissionManager
+from chapgent.core.providers import LLMProvider, LLMResponse, TokenUsage
 from chapgent.core.providers import TextBlock as ProvTextBlock
 from chapgent.core.providers import ToolUseBlock as ProvToolUseBlock
 from chapgent.core.acp_provider import (
@@ -29,44 +33,86 @@ from chapgent.core.acp_provider import (
 )
 from chapgent.session.models import Message, Session, ToolResultBlock
 from chapgent.tools.base import ToolCategory, ToolDefinition, ToolRisk
+from chapgent.tools.registry import ToolRegistry
 
+# Final response shared by many tests. The loop only reads responses, so one
+# instance per module is enough.
+_DONE_RESPONSE = LLMResponse(content=[ProvTextBlock(text="Done")], stop_reason="end_turn")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_provider():
-    """Mock LLM provider."""
-    return AsyncMock()
+    """Mock LLM provider (shared across the module, reset per test)."""
+    return AsyncMock(spec_set=LLMProvider)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_registry():
-    """Mock tool registry."""
-    registry = MagicMock()
-    registry.list_definitions.return_value = []
-    registry.get.return_value = None
-    return registry
+    """Mock tool registry (shared across the module, reset per test)."""
+    return MagicMock(spec_set=ToolRegistry)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_permissions():
-    """Mock permission manager that always approves."""
-    pm = AsyncMock()
-    pm.check.return_value = True
-    return pm
+    """Mock permission manager (shared across the module, reset per test)."""
+    return AsyncMock(spec_set=PermissionManager)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_provider, mock_registry, mock_permissions):
+    """Restore the shared mocks to their default behavior before each test.
+
+    The registry finds no tools and the permission manager always approves.
+    """
+    for mock in (mock_provider, mock_registry, mock_permissions):
+        mock.reset_mock(return_value=True, side_effect=True)
+    mock_registry.list_definitions.return_value = []
+    mock_registry.get.return_value = None
+    mock_permissions.check.return_value = True
+
+
+def _session_id() -> str:
+    """Session id unique to this test worker process and call."""
+    return f"test-session-{os.getpid()}-{uuid.uuid4().hex[:6]}"
 
 
 @pytest.fixture
 def session():
     """Fresh session for testing."""
-    return Session(id="test-session", messages=[])
+    return Session(id=_session_id(), messages=[])
 
 
-def make_tool(name: str, func):
+@pytest.fixture(scope="module")
+def agent(mock_provider, mock_registry, mock_permissions):
+    """Agent shared by tests that don't depend on a fresh session."""
+    return Agent(mock_provider, mock_registry, mock_permissions, Session(id=_session_id(), messages=[]))
+
+
+@pytest.fixture(autouse=True)
+def _reset_agent(agent):
+    """Clear the shared agent's session between tests."""
+    agent.session.messages.clear()
+
+
+async def _collect(events):
+    """Drain an async event stream into lists bucketed by event type.
+
+    Every event is also appended to the ``"_all"`` bucket, in arrival order.
+    """
+    buckets = defaultdict(list)
+    async for event in events:
+        buckets[event.type].append(event)
+        buckets["_all"].append(event)
+    return buckets
+
+
+def make_tool(name: str, func, risk: ToolRisk = ToolRisk.LOW):
     """Helper to create a tool definition."""
     return ToolDefinition(
         name=name,
         description=f"Tool {name}",
         input_schema={},
-        risk=ToolRisk.LOW,
+        risk=risk,
         category=ToolCategory.SHELL,
         function=func,
     )
@@ -77,142 +123,107 @@ def make_tool(name: str, func):
 # =============================================================================
 
 
-class TestToolExecution:
-    """Loop executes tools requested by the LLM."""
-
-    @pytest.mark.asyncio
-    async def test_executes_tool_and_returns_result(self, mock_provider, mock_registry, mock_permissions, session):
-        """Loop executes tool and yields result event."""
-
-        async def greet_tool(name: str = "World"):
-            return f"Hello, {name}!"
-
-        tool_def = make_tool("greet", greet_tool)
-        mock_registry.get.return_value = tool_def
-        mock_registry.list_definitions.return_value = [{"name": "greet"}]
-
-        mock_provider.complete.side_effect = [
-            LLMResponse(
-                content=[ProvToolUseBlock(id="call_1", name="greet", input={"name": "Alice"})],
-                stop_reason="tool_use",
-            ),
-            LLMResponse(content=[ProvTextBlock(text="Done")], stop_reason="end_turn"),
-        ]
-
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
-        messages = [Message(role="user", content="Greet Alice")]
-
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
-
-        # Should have tool_call and tool_result events
-        event_types = [e.type for e in events]
-        assert "tool_call" in event_types
-        assert "tool_result" in event_types
-
-        # Result should contain the greeting
-        result_events = [e for e in events if e.type == "tool_result"]
-        assert "Hello, Alice!" in result_events[0].content
-
-    @pytest.mark.asyncio
-    async def test_handles_unknown_tool(self, mock_provider, mock_registry, mock_permissions, session):
-        """Loop handles unknown tool gracefully with error result."""
-        mock_provider.complete.side_effect = [
-            LLMResponse(
-                content=[ProvToolUseBlock(id="call_1", name="unknown_tool", input={})],
-                stop_reason="tool_use",
-            ),
-            LLMResponse(content=[ProvTextBlock(text="Done")], stop_reason="end_turn"),
-        ]
-        mock_registry.get.return_value = None
-
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
-        messages = [Message(role="user", content="Use unknown tool")]
-
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
-
-        # Should have error result
-        error_results = [e for e in events if e.type == "tool_result" and e.content]
-        assert len(error_results) >= 1
-        assert "not found" in error_results[0].content.lower()
-
-    @pytest.mark.asyncio
-    async def test_handles_tool_exception(self, mock_provider, mock_registry, mock_permissions, session):
-        """Loop handles tool exceptions gracefully."""
-
-        async def failing_tool(**kwargs):
-            raise RuntimeError("Tool crashed!")
-
-        tool_def = make_tool("failing", failing_tool)
-        mock_registry.get.return_value = tool_def
-        mock_registry.list_definitions.return_value = [{"name": "failing"}]
-
-        mock_provider.complete.side_effect = [
-            LLMResponse(
-                content=[ProvToolUseBlock(id="call_1", name="failing", input={})],
-                stop_reason="tool_use",
-            ),
-            LLMResponse(content=[ProvTextBlock(text="Error noted")], stop_reason="end_turn"),
-        ]
-
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
-        messages = [Message(role="user", content="Run failing tool")]
+async def _greet_tool(name: str = "World"):
+    return f"Hello, {name}!"
+
+
+async def _failing_tool(**kwargs):
+    raise RuntimeError("Tool crashed!")
+
+
+async def _risky_tool(**kwargs):
+    return "Should not run"
+
+
+async def _unreadable_tool(**kwargs):
+    raise PermissionError("[Errno 13] Permission denied: '/root/secret'")
+
+
+# (tool name, registered definition, tool input, permission granted, expected event type, expected text)
+TOOL_CALL_CASES = [
+    pytest.param(
+        "greet",
+        make_tool("greet", _greet_tool),
+        {"name": "Alice"},
+        True,
+        "tool_result",
+        "Hello, Alice!",
+        id="executes_tool_and_returns_result",
+    ),
+    pytest.param("unknown_tool", None, {}, True, "tool_result", "not found", id="handles_unknown_tool"),
+    pytest.param(
+        "failing",
+        make_tool("failing", _failing_tool),
+        {},
+        True,
+        "tool_result",
+        "Tool crashed!",
+        id="handles_tool_exception",
+    ),
+    pytest.param(
+        "risky",
+        make_tool("risky", _risky_tool, risk=ToolRisk.HIGH),
+        {},
+        False,
+        "permission_denied",
+        None,
+        id="handles_permission_denied",
+    ),
+    pytest.param(
+        "unreadable",
+        make_tool("unreadable", _unreadable_tool),
+        {},
+        True,
+        "tool_result",
+        "Errno 13",
+        id="os_permission_error_is_tool_error",
+    ),
+]
 
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
 
-        # Should have error in result
-        error_results = [e for e in events if e.type == "tool_result"]
-        assert len(error_results) >= 1
-        assert "Tool crashed!" in error_results[0].content
+class TestToolExecution:
+    """Loop executes tools requested by the LLM."""
 
     @pytest.mark.asyncio
-    async def test_handles_permission_denied(self, mock_provider, mock_registry, session):
-        """Loop yields permission_denied event when tool is blocked."""
-
-        async def risky_tool(**kwargs):
-            return "Should not run"
-
-        tool_def = make_tool("risky", risky_tool)
-        tool_def = ToolDefinition(
-            name="risky",
-            description="Risky tool",
-            input_schema={},
-            risk=ToolRisk.HIGH,
-            category=ToolCategory.SHELL,
-            function=risky_tool,
-        )
+    @pytest.mark.parametrize("tool_name,tool_def,tool_input,allowed,expected_type,expected_text", TOOL_CALL_CASES)
+    async def test_tool_call_outcome(
+        self,
+        mock_provider,
+        mock_registry,
+        mock_permissions,
+        agent,
+        tool_name,
+        tool_def,
+        tool_input,
+        allowed,
+        expected_type,
+        expected_text,
+    ):
+        """Loop executes the requested tool, or reports why it could not."""
         mock_registry.get.return_value = tool_def
-        mock_registry.list_definitions.return_value = [{"name": "risky"}]
-
-        # Permission denied
-        mock_permissions = AsyncMock()
-        mock_permissions.check.return_value = False
+        if tool_def is not None:
+            mock_registry.list_definitions.return_value = [{"name": tool_name}]
+        mock_permissions.check.return_value = allowed
 
         mock_provider.complete.side_effect = [
             LLMResponse(
-                content=[ProvToolUseBlock(id="call_1", name="risky", input={})],
+                content=[ProvToolUseBlock(id="call_1", name=tool_name, input=tool_input)],
                 stop_reason="tool_use",
             ),
-            LLMResponse(content=[ProvTextBlock(text="Permission denied")], stop_reason="end_turn"),
+            _DONE_RESPONSE,
         ]
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
-        messages = [Message(role="user", content="Do risky thing")]
+        messages = [Message(role="user", content=f"Use {tool_name}")]
 
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages))
 
-        event_types = [e.type for e in events]
-        assert "permission_denied" in event_types
+        matching = events[expected_type]
+        assert len(matching) >= 1
+        if expected_text is not None:
+            assert expected_text.lower() in matching[0].content.lower()
 
     @pytest.mark.asyncio
-    async def test_executes_multiple_tools_in_sequence(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_executes_multiple_tools_in_sequence(self, mock_provider, mock_registry, agent):
         """Loop executes multiple tool calls in sequence."""
 
         async def tool_a(**kwargs):
@@ -238,17 +249,14 @@ class TestToolExecution:
                 content=[ProvToolUseBlock(id="call_2", name="tool_b", input={})],
                 stop_reason="tool_use",
             ),
-            LLMResponse(content=[ProvTextBlock(text="Done")], stop_reason="end_turn"),
+            _DONE_RESPONSE,
         ]
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Run both tools")]
 
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages))
 
-        tool_results = [e for e in events if e.type == "tool_result"]
+        tool_results = events["tool_result"]
         assert len(tool_results) == 2
 
 
@@ -261,7 +269,7 @@ class TestIterationLimits:
     """Loop respects iteration limits."""
 
     @pytest.mark.asyncio
-    async def test_stops_at_iteration_limit(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_stops_at_iteration_limit(self, mock_provider, mock_registry, agent):
         """Loop stops and yields event when max iterations reached."""
 
         async def endless_tool(**kwargs):
@@ -278,19 +286,15 @@ class TestIterationLimits:
             usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
         )
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Run forever")]
 
-        events = []
-        async for event in conversation_loop(agent, messages, max_iterations=3):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages, max_iterations=3))
 
-        event_types = [e.type for e in events]
-        assert "iteration_limit_reached" in event_types
-        assert events[-1].type == "finished"
+        assert "iteration_limit_reached" in events
+        assert events["_all"][-1].type == "finished"
 
     @pytest.mark.asyncio
-    async def test_completes_normally_under_limit(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_completes_normally_under_limit(self, mock_provider, agent):
         """Loop completes without limit event when under max iterations."""
         mock_provider.complete.return_value = LLMResponse(
             content=[ProvTextBlock(text="Done")],
@@ -298,16 +302,12 @@ class TestIterationLimits:
             usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
         )
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Simple task")]
 
-        events = []
-        async for event in conversation_loop(agent, messages, max_iterations=10):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages, max_iterations=10))
 
-        event_types = [e.type for e in events]
-        assert "iteration_limit_reached" not in event_types
-        assert events[-1].type == "finished"
+        assert "iteration_limit_reached" not in events
+        assert events["_all"][-1].type == "finished"
 
     def test_default_iteration_limit(self):
         """Default max iterations is 50."""
@@ -323,7 +323,7 @@ class TestTokenLimits:
     """Loop respects token limits."""
 
     @pytest.mark.asyncio
-    async def test_stops_at_token_limit(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_stops_at_token_limit(self, mock_provider, mock_registry, agent):
         """Loop stops and yields event when max tokens exceeded."""
 
         async def heavy_tool(**kwargs):
@@ -340,19 +340,15 @@ class TestTokenLimits:
             usage=TokenUsage(prompt_tokens=70, completion_tokens=30, total_tokens=100),
         )
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Use tokens")]
 
-        events = []
-        async for event in conversation_loop(agent, messages, max_tokens=250):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages, max_tokens=250))
 
-        event_types = [e.type for e in events]
-        assert "token_limit_reached" in event_types
-        assert events[-1].type == "finished"
+        assert "token_limit_reached" in events
+        assert events["_all"][-1].type == "finished"
 
     @pytest.mark.asyncio
-    async def test_no_limit_when_max_tokens_none(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_no_limit_when_max_tokens_none(self, mock_provider, mock_registry, agent):
         """Loop has no token limit when max_tokens is None."""
 
         async def tool_fn(**kwargs):
@@ -375,15 +371,11 @@ class TestTokenLimits:
             ),
         ]
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Test")]
 
-        events = []
-        async for event in conversation_loop(agent, messages, max_tokens=None):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages, max_tokens=None))
 
-        event_types = [e.type for e in events]
-        assert "token_limit_reached" not in event_types
+        assert "token_limit_reached" not in events
 
 
 # =============================================================================
@@ -395,7 +387,7 @@ class TestTokenTracking:
     """Loop tracks token usage across iterations."""
 
     @pytest.mark.asyncio
-    async def test_tracks_cumulative_tokens(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_tracks_cumulative_tokens(self, mock_provider, mock_registry, agent):
         """Loop tracks total tokens across multiple iterations."""
 
         async def tool_fn(**kwargs):
@@ -418,15 +410,12 @@ class TestTokenTracking:
             ),
         ]
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Test")]
 
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages))
 
         # Final event should have cumulative token count
-        finished = events[-1]
+        finished = events["_all"][-1]
         assert finished.type == "finished"
         assert finished.total_tokens == 225  # 75 + 150
 
@@ -440,7 +429,7 @@ class TestSystemPrompt:
     """Loop supports custom system prompts."""
 
     @pytest.mark.asyncio
-    async def test_uses_custom_system_prompt(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_uses_custom_system_prompt(self, mock_provider, agent):
         """Loop passes custom system prompt to provider."""
         mock_provider.complete.return_value = LLMResponse(
             content=[ProvTextBlock(text="I am a helpful pirate!")],
@@ -448,18 +437,14 @@ class TestSystemPrompt:
             usage=TokenUsage(prompt_tokens=20, completion_tokens=10, total_tokens=30),
         )
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Hello")]
 
-        events = []
-        async for event in conversation_loop(agent, messages, system_prompt="You are a pirate."):
-            events.append(event)
+        await _collect(conversation_loop(agent, messages, system_prompt="You are a pirate."))
 
-        # Check that provider was called with system prompt
+        # System prompt is prepended as the first message sent to the provider
         call_args = mock_provider.complete.call_args
         assert call_args is not None
-        # System prompt should be in the call
-        assert "pirate" in str(call_args).lower() or mock_provider.complete.called
+        assert call_args.kwargs["messages"][0] == {"role": "system", "content": "You are a pirate."}
 
 
 # =============================================================================
@@ -471,22 +456,18 @@ class TestErrorHandling:
     """Loop handles LLM and other errors gracefully."""
 
     @pytest.mark.asyncio
-    async def test_handles_llm_error(self, mock_provider, mock_registry, mock_permissions, session):
+    async def test_handles_llm_error(self, mock_provider, agent):
         """Loop handles LLM provider errors with llm_error event."""
         mock_provider.complete.side_effect = RuntimeError("LLM API error")
 
-        agent = Agent(mock_provider, mock_registry, mock_permissions, session)
         messages = [Message(role="user", content="Test")]
 
-        events = []
-        async for event in conversation_loop(agent, messages):
-            events.append(event)
+        events = await _collect(conversation_loop(agent, messages))
 
         # Should yield an llm_error event
-        event_types = [e.type for e in events]
-        assert "llm_error" in event_types
+        assert "llm_error" in events
 
-        error_event = [e for e in events if e.type == "llm_error"][0]
+        error_event = events["llm_error"][0]
         assert "LLM API error" in error_event.content
 
     @pytest.mark.asyncio
@@ -505,7 +486,7 @@ class TestErrorHandling:
                 content=[ProvToolUseBlock(id="call_1", name="error_tool", input={})],
                 stop_reason="tool_use",
             ),
-            LLMResponse(content=[ProvTextBlock(text="Done")], stop_reason="end_turn"),
+            _DONE_RESPONSE,
         ]
 
         agent = Agent(mock_provider, mock_registry, mock_permissions, session)
@@ -551,12 +532,10 @@ class TestStreamingLoopTextDeltas:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Say hello"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Say hello"))
 
         # Should receive text_delta events
-        text_deltas = [e for e in loop_events if e.type == "text_delta"]
+        text_deltas = loop_events["text_delta"]
         assert len(text_deltas) == 2
         assert text_deltas[0].content == "Hello"
         assert text_deltas[1].content == ", world!"
@@ -571,11 +550,9 @@ class TestStreamingLoopTextDeltas:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Hello"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Hello"))
 
-        text_deltas = [e for e in loop_events if e.type == "text_delta"]
+        text_deltas = loop_events["text_delta"]
         assert len(text_deltas) == 2
         assert text_deltas[0].content == ""
         assert text_deltas[1].content == "Content"
@@ -595,17 +572,15 @@ class TestStreamingLoopToolCalls:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Read file.txt"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Read file.txt"))
 
         # Should have tool_call and tool_result events
-        tool_calls = [e for e in loop_events if e.type == "tool_call"]
+        tool_calls = loop_events["tool_call"]
         assert len(tool_calls) == 1
         assert tool_calls[0].tool_name == "Read"
         assert tool_calls[0].tool_id == "tool_123"
 
-        tool_results = [e for e in loop_events if e.type == "tool_result"]
+        tool_results = loop_events["tool_result"]
         assert len(tool_results) == 1
         assert tool_results[0].content == "File contents here"
 
@@ -618,11 +593,9 @@ class TestStreamingLoopToolCalls:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Write file"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Write file"))
 
-        tool_calls = [e for e in loop_events if e.type == "tool_call"]
+        tool_calls = loop_events["tool_call"]
         assert len(tool_calls) == 1
         # Content should be JSON serialized input
         input_dict = json.loads(tool_calls[0].content)
@@ -641,15 +614,13 @@ class TestStreamingLoopCompletion:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Test"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Test"))
 
         # Should end with finished event
-        assert loop_events[-1].type == "finished"
+        assert loop_events["_all"][-1].type == "finished"
 
         # Should have token totals from usage
-        finished_events = [e for e in loop_events if e.type == "finished" and e.total_tokens]
+        finished_events = [e for e in loop_events["finished"] if e.total_tokens]
         assert len(finished_events) >= 1
         assert finished_events[0].total_tokens == 150  # 100 + 50
 
@@ -662,12 +633,10 @@ class TestStreamingLoopCompletion:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Hello"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Hello"))
 
         # Last event must be finished
-        assert loop_events[-1].type == "finished"
+        assert loop_events["_all"][-1].type == "finished"
 
 
 class TestStreamingLoopErrors:
@@ -682,12 +651,10 @@ class TestStreamingLoopErrors:
         ]
         provider = create_mock_streaming_provider(events)
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Do something"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Do something"))
 
         # Should have llm_error event
-        error_events = [e for e in loop_events if e.type == "llm_error"]
+        error_events = loop_events["llm_error"]
         assert len(error_events) == 1
         assert error_events[0].content == "Something went wrong"
         assert error_events[0].error_type == "INTERNAL_ERROR"
@@ -704,12 +671,10 @@ class TestStreamingLoopErrors:
 
         provider.send_message = mock_send_message
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Test"):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Test"))
 
         # Should have llm_error event
-        error_events = [e for e in loop_events if e.type == "llm_error"]
+        error_events = loop_events["llm_error"]
         assert len(error_events) == 1
         assert "Connection failed" in error_events[0].content
 
@@ -730,12 +695,10 @@ class TestStreamingLoopCancellation:
         token = CancellationToken()
         token.cancel("User cancelled")
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Test", cancellation_token=token):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Test", cancellation_token=token))
 
         # Should have cancelled event
-        cancelled_events = [e for e in loop_events if e.type == "cancelled"]
+        cancelled_events = loop_events["cancelled"]
         assert len(cancelled_events) == 1
         assert "before starting" in cancelled_events[0].content
 
@@ -755,15 +718,12 @@ class TestStreamingLoopCancellation:
 
         provider.send_message = mock_send_message
 
-        loop_events = []
-        async for event in streaming_conversation_loop(provider, "Test", cancellation_token=token):
-            loop_events.append(event)
+        loop_events = await _collect(streaming_conversation_loop(provider, "Test", cancellation_token=token))
 
         # Should have cancelled event
-        event_types = [e.type for e in loop_events]
-        assert "cancelled" in event_types
+        assert "cancelled" in loop_events
 
         # Should still have first text delta
-        text_deltas = [e for e in loop_events if e.type == "text_delta"]
+        text_deltas = loop_events["text_delta"]
         assert len(text_deltas) >= 1
         assert text_deltas[0].content == "First"
@@ -11,22 +11,38 @@ Tests verify user-facing behavior:
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import Any
-from unittest.mock import MagicMock
+from functools import partial
+from typing import Any, NamedTuple
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from chapgent.core.agent import Agent
+from chapgent.core.cache import ToolCache
+from chapgent.core.cancellation import CancellationToken
 from chapgent.core.parallel import execute_tools_parallel
+from chapgent.core.permissions import PermissionManager
 from chapgent.tools.base import ToolCategory, ToolDefinition, ToolRisk
 
+try:
+    import uvloop
+except ImportError:  # Optional; not installed by default and unavailable on Windows
+    uvloop = None
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
 
 
-@dataclass
-class MockToolUseBlock:
+@pytest.fixture(scope="module")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run this module's tests on uvloop when it is installed."""
+    if uvloop is None:
+        return asyncio.get_event_loop_policy()
+    return uvloop.EventLoopPolicy()
+
+
+class MockToolUseBlock(NamedTuple):
     """Mock for ToolUseBlock from providers."""
 
     id: str
@@ -39,6 +55,11 @@ def make_tool_use(name: str, **kwargs: Any) -> Any:
     return MockToolUseBlock(id=f"{name}_id", name=name, input=kwargs)
 
 
+async def _return_value(return_value: str, **kwargs: Any) -> str:
+    """Tool body that ignores its arguments and returns a fixed value."""
+    return return_value
+
+
 def make_tool_def(
     name: str,
     return_value: str = "success",
@@ -46,17 +67,13 @@ def make_tool_def(
     func: Any = None,
 ) -> ToolDefinition:
     """Create a mock tool definition."""
-
-    async def mock_func(**kwargs: Any) -> str:
-        return return_value
-
     return ToolDefinition(
         name=name,
         description=f"Mock {name} tool",
         input_schema={"type": "object", "properties": {}},
         risk=ToolRisk.LOW,
         category=ToolCategory.FILESYSTEM,
-        function=func or mock_func,
+        function=func or partial(_return_value, return_value),
         read_only=read_only,
         cacheable=read_only,
     )
@@ -64,27 +81,29 @@ def make_tool_def(
 
 def make_mock_agent(allowed: bool = True, cached_result: str | None = None) -> MagicMock:
     """Create a mock agent with permissions and cache."""
-    agent = MagicMock()
+    agent = MagicMock(spec=Agent)
 
-    async def check_permission(**kwargs: Any) -> bool:
-        return allowed
+    agent.permissions = MagicMock(spec_set=PermissionManager)
+    agent.permissions.check = AsyncMock(return_value=allowed)
 
-    agent.permissions = MagicMock()
-    agent.permissions.check = check_permission
+    agent.tool_cache = MagicMock(spec_set=ToolCache)
+    agent.tool_cache.get = AsyncMock(return_value=cached_result)
+    agent.tool_cache.set = AsyncMock(return_value=None)
 
-    async def cache_get(tool_name: str, args: dict[str, Any], cacheable: bool = True) -> str | None:
-        if not cacheable:
-            return None
-        return cached_result
+    return agent
 
-    async def cache_set(tool_name: str, args: dict[str, Any], result: str, cacheable: bool = True) -> None:
-        pass
 
-    agent.tool_cache = MagicMock()
-    agent.tool_cache.get = cache_get
-    agent.tool_cache.set = cache_set
+@pytest.fixture(scope="module")
+def _shared_agent() -> MagicMock:
+    """Approving mock agent with an empty cache, built once per module."""
+    return make_mock_agent(allowed=True)
 
-    return agent
+
+@pytest.fixture
+def agent(_shared_agent: MagicMock) -> MagicMock:
+    """The shared approving agent with its recorded calls cleared."""
+    _shared_agent.reset_mock()
+    return _shared_agent
 
 
 # =============================================================================
@@ -96,7 +115,7 @@ class TestParallelReads:
     """Non-conflicting read operations execute in parallel."""
 
     @pytest.mark.asyncio
-    async def test_multiple_reads_execute_concurrently(self):
+    async def test_multiple_reads_execute_concurrently(self, agent: MagicMock):
         """Multiple read operations on different files run in parallel."""
         tools = []
         for i in range(3):
@@ -104,7 +123,6 @@ class TestParallelReads:
             tool_def = make_tool_def("read_file", return_value=f"content_{i}", read_only=True)
             tools.append((tool_use, tool_def))
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel(tools, agent)
 
         assert len(results) == 3
@@ -113,31 +131,76 @@ class TestParallelReads:
         assert [r.result for r in results] == ["content_0", "content_1", "content_2"]
 
     @pytest.mark.asyncio
-    async def test_parallel_execution_is_faster_than_sequential(self):
-        """Parallel reads complete faster than sequential execution would."""
-        import time
-
-        sleep_time = 0.05  # 50ms per operation
-
-        async def slow_read(**kwargs: Any) -> str:
-            await asyncio.sleep(sleep_time)
+    async def test_parallel_reads_are_in_flight_together(self, agent: MagicMock):
+        """Parallel reads are all in flight at once, which sequential execution never reaches."""
+        arrived = 0
+        all_arrived = asyncio.Event()
+
+        async def rendezvous_read(**kwargs: Any) -> str:
+            # Each read waits for the other two; run one at a time, this would hang
+            nonlocal arrived
+            arrived += 1
+            if arrived == 3:
+                all_arrived.set()
+            await all_arrived.wait()
             return "done"
 
         tools = []
         for i in range(3):
             tool_use = make_tool_use("read_file", path=f"/tmp/file{i}.txt")
-            tool_def = make_tool_def("read_file", read_only=True, func=slow_read)
+            tool_def = make_tool_def("read_file", read_only=True, func=rendezvous_read)
             tools.append((tool_use, tool_def))
 
-        agent = make_mock_agent(allowed=True)
+        results = await asyncio.wait_for(execute_tools_parallel(tools, agent), timeout=1.0)
+
+        assert len(results) == 3
+
+    @pytest.mark.asyncio
+    async def test_parallel_reads_are_bounded(self, agent: MagicMock, monkeypatch: pytest.MonkeyPatch):
+        """No more than MAX_PARALLEL_TOOLS reads run at the same time."""
+        monkeypatch.setattr("chapgent.core.parallel.MAX_PARALLEL_TOOLS", 2)
+        running = 0
+        peak = 0
+
+        async def tracked_read(**kwargs: Any) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return "done"
+
+        tools = [
+            (
+                make_tool_use("read_file", path=f"/tmp/file{i}.txt"),
+                make_tool_def("read_file", read_only=True, func=tracked_read),
+            )
+            for i in range(5)
+        ]
 
-        start = time.time()
         results = await execute_tools_parallel(tools, agent)
-        elapsed = time.time() - start
 
-        # Parallel should take ~1x sleep_time, not 3x
-        assert elapsed < sleep_time * 2
-        assert len(results) == 3
+        assert len(results) == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_identical_reads_in_batch_run_once(self, agent: MagicMock):
+        """Identical read calls in one parallel batch share a single execution."""
+        calls = 0
+
+        async def counting_status(**kwargs: Any) -> str:
+            nonlocal calls
+            calls += 1
+            return "clean"
+
+        tool_def = make_tool_def("git_status", read_only=True, func=counting_status)
+        tools = [(MockToolUseBlock(id=f"status_{i}", name="git_status", input={}), tool_def) for i in range(3)]
+
+        results = await execute_tools_parallel(tools, agent)
+
+        assert calls == 1
+        assert [r.tool_use_id for r in results] == ["status_0", "status_1", "status_2"]
+        assert all(r.result == "clean" for r in results)
 
 
 # =============================================================================
@@ -149,7 +212,7 @@ class TestSequentialWrites:
     """Write operations execute sequentially to prevent conflicts."""
 
     @pytest.mark.asyncio
-    async def test_writes_execute_in_order(self):
+    async def test_writes_execute_in_order(self, agent: MagicMock):
         """Write operations execute in the order they were requested."""
         execution_order: list[int] = []
 
@@ -166,14 +229,13 @@ class TestSequentialWrites:
             tool_def = make_tool_def("edit_file", func=make_tracking_func(i))
             tools.append((tool_use, tool_def))
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel(tools, agent)
 
         assert execution_order == [0, 1, 2]
         assert len(results) == 3
 
     @pytest.mark.asyncio
-    async def test_mixed_read_write_preserves_order(self):
+    async def test_mixed_read_write_preserves_order(self, agent: MagicMock):
         """Mixed read/write operations execute correctly with writes sequential."""
         tool_use1 = make_tool_use("read_file", path="/tmp/a.txt")
         tool_def1 = make_tool_def("read_file", return_value="a", read_only=True)
@@ -184,7 +246,6 @@ class TestSequentialWrites:
         tool_use3 = make_tool_use("read_file", path="/tmp/c.txt")
         tool_def3 = make_tool_def("read_file", return_value="c", read_only=True)
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel(
             [(tool_use1, tool_def1), (tool_use2, tool_def2), (tool_use3, tool_def3)],
             agent,
@@ -195,6 +256,60 @@ class TestSequentialWrites:
         assert results[1].result == "edited"
         assert results[2].result == "c"
 
+    @pytest.mark.asyncio
+    async def test_next_write_permission_checked_after_current_write(self):
+        """The next write's permission is only asked for once the current write finishes."""
+        events: list[str] = []
+
+        async def write_body(**kwargs: Any) -> str:
+            events.append(f"start {kwargs['file_path']}")
+            await asyncio.sleep(0)
+            events.append(f"end {kwargs['file_path']}")
+            return "ok"
+
+        async def check(tool_name: str, risk: ToolRisk, args: dict[str, Any]) -> bool:
+            events.append(f"check {args['file_path']}")
+            return True
+
+        tools = [
+            (make_tool_use("edit_file", file_path=f"/tmp/file{i}.txt"), make_tool_def("edit_file", func=write_body))
+            for i in range(2)
+        ]
+        agent = make_mock_agent(allowed=True)
+        agent.permissions.check = AsyncMock(side_effect=check)
+
+        results = await execute_tools_parallel(tools, agent)
+
+        assert [r.result for r in results] == ["ok", "ok"]
+        assert events == [
+            "check /tmp/file0.txt",
+            "start /tmp/file0.txt",
+            "end /tmp/file0.txt",
+            "check /tmp/file1.txt",
+            "start /tmp/file1.txt",
+            "end /tmp/file1.txt",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_turn_does_not_ask_for_next_write(self):
+        """Cancelling during a write never prompts for the write that is then skipped."""
+        token = CancellationToken()
+
+        async def write_body(**kwargs: Any) -> str:
+            token.cancel()
+            return "ok"
+
+        tools = [
+            (make_tool_use("edit_file", file_path=f"/tmp/file{i}.txt"), make_tool_def("edit_file", func=write_body))
+            for i in range(2)
+        ]
+        agent = make_mock_agent(allowed=True)
+
+        results = await execute_tools_parallel(tools, agent, cancellation_token=token)
+
+        assert [r.result for r in results] == ["ok"]
+        agent.permissions.check.assert_awaited_once()
+
 
 # =============================================================================
 # Error Handling - Permission denied and execution errors
@@ -218,7 +333,7 @@ class TestErrorHandling:
         assert "Permission denied" in results[0].result
 
     @pytest.mark.asyncio
-    async def test_execution_error_captured_in_result(self):
+    async def test_execution_error_captured_in_result(self, agent: MagicMock):
         """Tool execution errors are captured in result, not raised."""
 
         async def failing_func(**kwargs: Any) -> str:
@@ -227,7 +342,6 @@ class TestErrorHandling:
         tool_use = make_tool_use("read_file", path="/tmp/nonexistent.txt")
         tool_def = make_tool_def("read_file", func=failing_func, read_only=True)
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel([(tool_use, tool_def)], agent)
 
         assert len(results) == 1
@@ -235,7 +349,7 @@ class TestErrorHandling:
         assert "File not found" in results[0].result
 
     @pytest.mark.asyncio
-    async def test_one_failure_doesnt_affect_others(self):
+    async def test_one_failure_doesnt_affect_others(self, agent: MagicMock):
         """One tool failing doesn't prevent others from completing."""
 
         async def failing_func(**kwargs: Any) -> str:
@@ -250,7 +364,6 @@ class TestErrorHandling:
         tool_use3 = make_tool_use("read_file", path="/tmp/also_good.txt")
         tool_def3 = make_tool_def("read_file", return_value="also good", read_only=True)
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel(
             [(tool_use1, tool_def1), (tool_use2, tool_def2), (tool_use3, tool_def3)],
             agent,
@@ -295,19 +408,17 @@ class TestEdgeCases:
     """Edge cases are handled correctly."""
 
     @pytest.mark.asyncio
-    async def test_empty_tool_list_returns_empty(self):
+    async def test_empty_tool_list_returns_empty(self, agent: MagicMock):
         """Empty tool list returns empty results."""
-        agent = make_mock_agent()
         results = await execute_tools_parallel([], agent)
         assert results == []
 
     @pytest.mark.asyncio
-    async def test_single_tool_executes(self):
+    async def test_single_tool_executes(self, agent: MagicMock):
         """Single tool executes and returns result."""
         tool_use = make_tool_use("read_file", path="/tmp/single.txt")
         tool_def = make_tool_def("read_file", return_value="single", read_only=True)
 
-        agent = make_mock_agent(allowed=True)
         results = await execute_tools_parallel([(tool_use, tool_def)], agent)
 
         assert len(results) == 1
@@ -55,3 +55,17 @@ async def test_high_risk_always_prompts(mock_prompt):
     result = await pm.check("shell", ToolRisk.HIGH, {})
     assert result is True
     mock_prompt.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_override_toggle_takes_effect_immediately(mock_prompt):
+    # The TUI flips session_override on a live manager
+    pm = PermissionManager(prompt_callback=mock_prompt)
+
+    pm.session_override = True
+    assert await pm.check("edit_file", ToolRisk.MEDIUM, {}) is True
+    mock_prompt.assert_not_called()
+
+    pm.session_override = False
+    await pm.check("edit_file", ToolRisk.MEDIUM, {})
+    mock_prompt.assert_called_once()
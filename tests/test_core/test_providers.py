@@ -1,23 +1,84 @@
-from unittest.mock import AsyncMock, patch
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from chapgent.core.providers import LLMProvider, LLMResponse, TextBlock
+from chapgent.core.providers import LLMProvider, LLMResponse, TextBlock, ToolUseBlock
 from chapgent.tools.base import ToolCategory, ToolDefinition, ToolRisk
 
+# =============================================================================
+# LiteLLM response stubs (plain dataclasses, handed back as already-resolved futures)
+# =============================================================================
+
+
+@dataclass(slots=True)
+class _Function:
+    name: str
+    arguments: str | dict[str, Any]
+
+
+@dataclass(slots=True)
+class _ToolCall:
+    id: str
+    function: _Function
+
+
+@dataclass(slots=True)
+class _Message:
+    content: str | None
+    tool_calls: list[_ToolCall] | None = None
+
+
+@dataclass(slots=True)
+class _Choice:
+    finish_reason: str
+    message: _Message
+
+
+@dataclass(slots=True)
+class _Usage:
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+@dataclass(slots=True)
+class _Response:
+    choices: list[_Choice]
+    usage: _Usage | None = None
+
+
+def _response(
+    content: str | None,
+    tool_calls: list[_ToolCall] | None = None,
+    finish_reason: str = "stop",
+    usage: _Usage | None = None,
+) -> _Response:
+    """Build a single-choice litellm completion response."""
+    return _Response(choices=[_Choice(finish_reason=finish_reason, message=_Message(content, tool_calls))], usage=usage)
+
+
+def _resolved(value: Any) -> asyncio.Future[Any]:
+    """Wrap a value in an already-completed future, so a plain mock can stand in for a coroutine function."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
 
 @pytest.fixture
 def mock_litellm_completion():
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock:
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock:
         yield mock
 
 
 @pytest.mark.asyncio
 async def test_complete_text_only(mock_litellm_completion):
     # Setup mock response
-    mock_response = AsyncMock()
-    mock_response.choices = [AsyncMock(finish_reason="stop", message=AsyncMock(content="Hello world", tool_calls=None))]
-    mock_litellm_completion.return_value = mock_response
+    mock_litellm_completion.return_value = _resolved(_response("Hello world"))
 
     provider = LLMProvider(model="gpt-4o", api_key="test-key")
     messages = [{"role": "user", "content": "Hi"}]
@@ -31,20 +92,18 @@ async def test_complete_text_only(mock_litellm_completion):
     assert response.stop_reason == "stop"
 
     # Verify litellm call
-    mock_litellm_completion.assert_awaited_once()
-    call_kwargs = mock_litellm_completion.await_args.kwargs
+    mock_litellm_completion.assert_called_once()
+    call_kwargs = mock_litellm_completion.call_args.kwargs
     assert call_kwargs["model"] == "gpt-4o"
     assert call_kwargs["api_key"] == "test-key"
-    assert call_kwargs["messages"] == messages
+    assert call_kwargs["messages"] is messages  # forwarded without copying
 
 
 @pytest.mark.asyncio
 async def test_complete_with_tools_formatting():
     # Verify tools are correctly formatted for litellm
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_completion:
-        mock_response = AsyncMock()
-        mock_response.choices = [AsyncMock(finish_reason="stop", message=AsyncMock(content="ok", tool_calls=None))]
-        mock_completion.return_value = mock_response
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_completion:
+        mock_completion.return_value = _resolved(_response("ok"))
 
         provider = LLMProvider(model="claude-3")
 
@@ -62,7 +121,7 @@ async def test_complete_with_tools_formatting():
 
         await provider.complete(messages=[], tools=[tool_def])
 
-        call_kwargs = mock_completion.await_args.kwargs
+        call_kwargs = mock_completion.call_args.kwargs
         assert "tools" in call_kwargs
         tools_arg = call_kwargs["tools"]
         assert len(tools_arg) == 1
@@ -74,28 +133,19 @@ async def test_complete_with_tools_formatting():
 @pytest.mark.asyncio
 async def test_complete_with_tool_call_response_string_args():
     """Test parsing LLM response with tool calls (string JSON arguments)."""
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_completion:
         # Mock tool call with string arguments (OpenAI style)
-        mock_tool_call = AsyncMock()
-        mock_tool_call.id = "call_abc123"
-        mock_tool_call.function = AsyncMock()
-        mock_tool_call.function.name = "read_file"
-        mock_tool_call.function.arguments = '{"path": "/tmp/test.txt"}'  # String JSON
-
-        mock_response = AsyncMock()
-        mock_response.choices = [
-            AsyncMock(
-                finish_reason="tool_use",
-                message=AsyncMock(content="Let me read that file", tool_calls=[mock_tool_call]),
-            )
-        ]
-        mock_completion.return_value = mock_response
+        mock_tool_call = _ToolCall(
+            id="call_abc123",
+            function=_Function(name="read_file", arguments='{"path": "/tmp/test.txt"}'),  # String JSON
+        )
+        mock_completion.return_value = _resolved(
+            _response("Let me read that file", [mock_tool_call], finish_reason="tool_use")
+        )
 
         provider = LLMProvider(model="gpt-4o")
         response = await provider.complete(messages=[{"role": "user", "content": "Read file"}], tools=[])
 
-        from chapgent.core.providers import ToolUseBlock
-
         assert len(response.content) == 2  # TextBlock + ToolUseBlock
         tool_block = response.content[1]
         assert isinstance(tool_block, ToolUseBlock)
@@ -107,25 +157,17 @@ async def test_complete_with_tool_call_response_string_args():
 @pytest.mark.asyncio
 async def test_complete_with_tool_call_response_dict_args():
     """Test parsing LLM response with tool calls (dict arguments - pre-parsed)."""
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_completion:
         # Mock tool call with dict arguments (some providers return dicts already)
-        mock_tool_call = AsyncMock()
-        mock_tool_call.id = "call_xyz789"
-        mock_tool_call.function = AsyncMock()
-        mock_tool_call.function.name = "shell"
-        mock_tool_call.function.arguments = {"command": "ls -la", "timeout": 30}  # Already a dict
-
-        mock_response = AsyncMock()
-        mock_response.choices = [
-            AsyncMock(finish_reason="tool_use", message=AsyncMock(content=None, tool_calls=[mock_tool_call]))
-        ]
-        mock_completion.return_value = mock_response
+        mock_tool_call = _ToolCall(
+            id="call_xyz789",
+            function=_Function(name="shell", arguments={"command": "ls -la", "timeout": 30}),  # Already a dict
+        )
+        mock_completion.return_value = _resolved(_response(None, [mock_tool_call], finish_reason="tool_use"))
 
         provider = LLMProvider(model="claude-3")
         response = await provider.complete(messages=[], tools=[])
 
-        from chapgent.core.providers import ToolUseBlock
-
         assert len(response.content) == 1  # Only ToolUseBlock (no text)
         tool_block = response.content[0]
         assert isinstance(tool_block, ToolUseBlock)
@@ -137,25 +179,17 @@ async def test_complete_with_tool_call_response_dict_args():
 @pytest.mark.asyncio
 async def test_complete_with_tool_call_invalid_json_args():
     """Test parsing LLM response with invalid JSON in arguments (fail-safe)."""
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_completion:
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_completion:
         # Mock tool call with invalid JSON string
-        mock_tool_call = AsyncMock()
-        mock_tool_call.id = "call_broken"
-        mock_tool_call.function = AsyncMock()
-        mock_tool_call.function.name = "some_tool"
-        mock_tool_call.function.arguments = "{invalid json here}"  # Invalid JSON
-
-        mock_response = AsyncMock()
-        mock_response.choices = [
-            AsyncMock(finish_reason="tool_use", message=AsyncMock(content=None, tool_calls=[mock_tool_call]))
-        ]
-        mock_completion.return_value = mock_response
+        mock_tool_call = _ToolCall(
+            id="call_broken",
+            function=_Function(name="some_tool", arguments="{invalid json here}"),  # Invalid JSON
+        )
+        mock_completion.return_value = _resolved(_response(None, [mock_tool_call], finish_reason="tool_use"))
 
         provider = LLMProvider(model="gpt-4o")
         response = await provider.complete(messages=[], tools=[])
 
-        from chapgent.core.providers import ToolUseBlock
-
         # Should fall back to empty dict on JSON decode error
         assert len(response.content) == 1
         tool_block = response.content[0]
@@ -166,33 +200,16 @@ async def test_complete_with_tool_call_invalid_json_args():
 @pytest.mark.asyncio
 async def test_complete_multiple_tool_calls():
     """Test parsing response with multiple tool calls."""
-    with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_completion:
-        mock_tool_call_1 = AsyncMock()
-        mock_tool_call_1.id = "call_1"
-        mock_tool_call_1.function = AsyncMock()
-        mock_tool_call_1.function.name = "read_file"
-        mock_tool_call_1.function.arguments = '{"path": "a.txt"}'
-
-        mock_tool_call_2 = AsyncMock()
-        mock_tool_call_2.id = "call_2"
-        mock_tool_call_2.function = AsyncMock()
-        mock_tool_call_2.function.name = "read_file"
-        mock_tool_call_2.function.arguments = '{"path": "b.txt"}'
-
-        mock_response = AsyncMock()
-        mock_response.choices = [
-            AsyncMock(
-                finish_reason="tool_use",
-                message=AsyncMock(content="Reading both files", tool_calls=[mock_tool_call_1, mock_tool_call_2]),
-            )
-        ]
-        mock_completion.return_value = mock_response
+    with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_completion:
+        mock_tool_call_1 = _ToolCall(id="call_1", function=_Function(name="read_file", arguments='{"path": "a.txt"}'))
+        mock_tool_call_2 = _ToolCall(id="call_2", function=_Function(name="read_file", arguments='{"path": "b.txt"}'))
+        mock_completion.return_value = _resolved(
+            _response("Reading both files", [mock_tool_call_1, mock_tool_call_2], finish_reason="tool_use")
+        )
 
         provider = LLMProvider(model="gpt-4o")
         response = await provider.complete(messages=[], tools=[])
 
-        from chapgent.core.providers import ToolUseBlock
-
         assert len(response.content) == 3  # TextBlock + 2 ToolUseBlocks
         assert isinstance(response.content[1], ToolUseBlock)
         assert isinstance(response.content[2], ToolUseBlock)
@@ -208,23 +225,13 @@ async def test_complete_multiple_tool_calls():
 class TestLLMProviderGatewaySupport:
     """Tests for LiteLLM Gateway / base_url / extra_headers support."""
 
-    def _mock_response(self):
-        """Create a mock LiteLLM response."""
-        response = AsyncMock()
-        response.choices = [
-            AsyncMock(
-                finish_reason="stop",
-                message=AsyncMock(content="Test response", tool_calls=None),
-            )
-        ]
-        response.usage = AsyncMock()
-        response.usage.prompt_tokens = 10
-        response.usage.completion_tokens = 5
-        response.usage.total_tokens = 15
-        return response
+    @pytest.fixture(scope="class")
+    def stock_response(self) -> _Response:
+        """LiteLLM response shared by the class; the provider only reads it."""
+        return _response("Test response", usage=_Usage(prompt_tokens=10, completion_tokens=5, total_tokens=15))
 
     @pytest.mark.asyncio
-    async def test_base_url_passed_to_litellm(self):
+    async def test_base_url_passed_to_litellm(self, stock_response):
         """Verify base_url is passed as api_base to litellm."""
         provider = LLMProvider(
             model="test-model",
@@ -232,8 +239,8 @@ class TestLLMProviderGatewaySupport:
             base_url="http://localhost:4000",
         )
 
-        with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = self._mock_response()
+        with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_complete:
+            mock_complete.return_value = _resolved(stock_response)
 
             await provider.complete(
                 messages=[{"role": "user", "content": "test"}],
@@ -245,7 +252,7 @@ class TestLLMProviderGatewaySupport:
             assert call_kwargs["api_base"] == "http://localhost:4000"
 
     @pytest.mark.asyncio
-    async def test_extra_headers_passed_to_litellm(self):
+    async def test_extra_headers_passed_to_litellm(self, stock_response):
         """Verify extra_headers are passed to litellm."""
         headers = {"x-litellm-api-key": "Bearer sk-test", "x-custom": "value"}
         provider = LLMProvider(
@@ -253,8 +260,8 @@ class TestLLMProviderGatewaySupport:
             extra_headers=headers,
         )
 
-        with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = self._mock_response()
+        with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_complete:
+            mock_complete.return_value = _resolved(stock_response)
 
             await provider.complete(
                 messages=[{"role": "user", "content": "test"}],
@@ -265,12 +272,12 @@ class TestLLMProviderGatewaySupport:
             assert call_kwargs["extra_headers"] == headers
 
     @pytest.mark.asyncio
-    async def test_none_values_passed_correctly(self):
-        """Verify None values for base_url and extra_headers are passed."""
+    async def test_none_values_passed_correctly(self, stock_response):
+        """Verify unset base_url and extra_headers are left out of the litellm call."""
         provider = LLMProvider(model="test-model")
 
-        with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = self._mock_response()
+        with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_complete:
+            mock_complete.return_value = _resolved(stock_response)
 
             await provider.complete(
                 messages=[{"role": "user", "content": "test"}],
@@ -278,11 +285,12 @@ class TestLLMProviderGatewaySupport:
             )
 
             call_kwargs = mock_complete.call_args.kwargs
-            assert call_kwargs.get("api_base") is None
-            assert call_kwargs.get("extra_headers") is None
+            assert "api_base" not in call_kwargs
+            assert "extra_headers" not in call_kwargs
+            assert "tools" not in call_kwargs
 
     @pytest.mark.asyncio
-    async def test_full_gateway_config(self):
+    async def test_full_gateway_config(self, stock_response):
         """Test provider with full gateway configuration."""
         provider = LLMProvider(
             model="anthropic-claude",
@@ -294,8 +302,8 @@ class TestLLMProviderGatewaySupport:
             },
         )
 
-        with patch("chapgent.core.providers.litellm.acompletion", new_callable=AsyncMock) as mock_complete:
-            mock_complete.return_value = self._mock_response()
+        with patch("chapgent.core.providers.litellm.acompletion", new_callable=MagicMock) as mock_complete:
+            mock_complete.return_value = _resolved(stock_response)
 
             response = await provider.complete(
                 messages=[{"role": "user", "content": "test"}],
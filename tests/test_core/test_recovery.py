@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import builtins
 import json
+import re
 
 import pytest
 from hypothesis import given, settings
@@ -16,6 +18,13 @@ from chapgent.core.recovery import (
     RecoveryAction,
 )
 
+# Builtin exception classes that have a registered pattern, resolved once
+_BUILTIN_PATTERN_CLASSES: dict[str, type[BaseException]] = {
+    name: cls
+    for name in ERROR_PATTERNS
+    if isinstance(cls := getattr(builtins, name, None), type) and issubclass(cls, BaseException)
+}
+
 
 class TestErrorType:
     """Tests for ErrorType enum."""
@@ -158,9 +167,9 @@ class TestMessagePatterns:
 class TestErrorRecovery:
     """Tests for ErrorRecovery class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def recovery(self) -> ErrorRecovery:
-        """Create ErrorRecovery instance."""
+        """Create an ErrorRecovery instance shared by the class (tests only read from it)."""
         return ErrorRecovery()
 
     @pytest.mark.parametrize(
@@ -196,7 +205,16 @@ class TestErrorRecovery:
         """Test handling json.JSONDecodeError (subclass of ValueError)."""
         error = json.JSONDecodeError("Invalid JSON", "{invalid", 0)
         action = recovery.handle_tool_error("web_fetch", error)
-        assert action.error_type in (ErrorType.JSON_DECODE_ERROR, ErrorType.INVALID_ARGUMENT)
+        assert action.error_type == ErrorType.JSON_DECODE_ERROR
+
+    def test_subclass_uses_nearest_registered_parent(self, recovery: ErrorRecovery) -> None:
+        """Test an unregistered subclass is classified by its closest registered ancestor."""
+
+        class ConfigMissingError(FileNotFoundError):
+            pass
+
+        action = recovery.handle_tool_error("read_file", ConfigMissingError("config.toml"))
+        assert action.error_type == ErrorType.FILE_NOT_FOUND
 
     def test_handle_unknown_error(self, recovery: ErrorRecovery) -> None:
         """Test handling unknown error type includes tool name."""
@@ -226,6 +244,27 @@ class TestErrorRecovery:
         action = recovery.handle_tool_error("test_tool", error)
         assert action.error_type == expected_type
 
+    def test_message_patterns_keep_list_priority(self, recovery: ErrorRecovery) -> None:
+        """Test the earliest listed pattern wins, even if a later one matches earlier in the text."""
+
+        class GenericError(Exception):
+            pass
+
+        error = GenericError("Permission denied while reading: No such file or directory")
+        action = recovery.handle_tool_error("test_tool", error)
+        assert action.error_type == ErrorType.FILE_NOT_FOUND
+
+    def test_non_ascii_message_matches(self, recovery: ErrorRecovery) -> None:
+        """Test that messages outside ASCII still match case-insensitively."""
+        action = recovery.handle_tool_error("read_file", RuntimeError("PERMISSION DENIED: café.txt"))
+        assert action.error_type == ErrorType.PERMISSION_DENIED
+
+    def test_module_name_keeps_its_case(self, recovery: ErrorRecovery) -> None:
+        """Test that captured groups come from the original, not lowercased, message."""
+        action = recovery.handle_tool_error("shell", RuntimeError("No module named 'PIL'"))
+        assert action.error_type == ErrorType.MODULE_NOT_FOUND
+        assert "Install with: pip install PIL" in action.suggestions
+
 
 class TestErrorRecoveryCustomPatterns:
     """Tests for custom error pattern registration."""
@@ -257,6 +296,56 @@ class TestErrorRecoveryCustomPatterns:
         action = recovery.handle_tool_error("api_call", APIError("Error 429: rate limit exceeded"))
         assert action.error_type == ErrorType.TIMEOUT
 
+    def test_mixed_case_custom_pattern_stays_case_insensitive(self, recovery: ErrorRecovery) -> None:
+        """Test that custom patterns with uppercase syntax still match any case."""
+        recovery.add_message_pattern(r"Quota\S*Exceeded", ErrorType.TIMEOUT, ["Quota hit."])
+
+        action = recovery.handle_tool_error("api_call", RuntimeError("QUOTA_LIMIT_EXCEEDED"))
+        assert action.error_type == ErrorType.TIMEOUT
+
+        action = recovery.handle_tool_error("api_call", RuntimeError("quota exceeded"))
+        assert action.error_type == ErrorType.UNKNOWN
+
+    def test_custom_pattern_with_global_inline_flag(self, recovery: ErrorRecovery) -> None:
+        """Test that a custom pattern carrying its own (?i) flag matches alongside the builtins."""
+        recovery.add_message_pattern(r"(?i)rate limit", ErrorType.TIMEOUT, ["Rate limited."])
+
+        action = recovery.handle_tool_error("api_call", RuntimeError("Rate Limit reached"))
+        assert action.error_type == ErrorType.TIMEOUT
+
+        action = recovery.handle_tool_error("read_file", RuntimeError("No such file or directory"))
+        assert action.error_type == ErrorType.FILE_NOT_FOUND
+
+    def test_custom_pattern_keeps_scoped_case_sensitivity(self, recovery: ErrorRecovery) -> None:
+        """Test that a (?-i:...) group is not defeated by matching the lowercased message."""
+        recovery.add_message_pattern(r"(?-i:fatal)", ErrorType.TIMEOUT, ["Fatal."])
+
+        assert recovery.handle_tool_error("shell", RuntimeError("fatal: bad object")).error_type == ErrorType.TIMEOUT
+        assert recovery.handle_tool_error("shell", RuntimeError("FATAL: bad object")).error_type == ErrorType.UNKNOWN
+
+    def test_custom_pattern_with_uppercase_escape(self, recovery: ErrorRecovery) -> None:
+        """Test that an escape spelling an uppercase letter still matches case-insensitively."""
+        recovery.add_message_pattern(r"\x46atal", ErrorType.TIMEOUT, ["Fatal."])
+
+        assert recovery.handle_tool_error("shell", RuntimeError("fatal: bad object")).error_type == ErrorType.TIMEOUT
+
+    def test_custom_patterns_may_reuse_group_names(self, recovery: ErrorRecovery) -> None:
+        """Test that custom patterns sharing a named group each still match."""
+        recovery.add_message_pattern(r"quota (?P<what>\w+)", ErrorType.TIMEOUT, ["Quota hit."])
+        recovery.add_message_pattern(r"host (?P<what>\w+) unreachable", ErrorType.CONNECTION_ERROR, ["Down."])
+
+        action = recovery.handle_tool_error("api_call", RuntimeError("host db unreachable"))
+        assert action.error_type == ErrorType.CONNECTION_ERROR
+
+    def test_invalid_custom_pattern_is_rejected_when_added(self, recovery: ErrorRecovery) -> None:
+        """Test that an invalid pattern raises on registration and leaves matching intact."""
+        with pytest.raises(re.error):
+            recovery.add_message_pattern(r"unbalanced (", ErrorType.TIMEOUT, ["Never."])
+
+        assert recovery._message_patterns is MESSAGE_PATTERNS
+        action = recovery.handle_tool_error("read_file", RuntimeError("No such file or directory"))
+        assert action.error_type == ErrorType.FILE_NOT_FOUND
+
     def test_class_based_pattern_priority_over_message(self, recovery: ErrorRecovery) -> None:
         """Test class-based patterns have priority over message patterns."""
         recovery.add_message_pattern(r"special error", ErrorType.CONNECTION_ERROR, ["Special."])
@@ -264,6 +353,28 @@ class TestErrorRecoveryCustomPatterns:
         action = recovery.handle_tool_error("read_file", error)
         assert action.error_type == ErrorType.FILE_NOT_FOUND  # Class wins
 
+    def test_returned_suggestions_are_independent_copies(self, recovery: ErrorRecovery) -> None:
+        """Test that mutating returned suggestions leaves the builtin tables untouched."""
+        before = list(ERROR_PATTERNS["FileNotFoundError"]["suggest"])
+
+        action = recovery.handle_tool_error("read_file", FileNotFoundError("gone"))
+        action.suggestions.append("extra")
+
+        assert ERROR_PATTERNS["FileNotFoundError"]["suggest"] == before
+
+    def test_custom_patterns_do_not_leak_between_instances(self, recovery: ErrorRecovery) -> None:
+        """Test that adding patterns copies the shared builtin tables first."""
+        other = ErrorRecovery()
+        other.handle_tool_error("shell", RuntimeError("rate limit exceeded"))
+
+        recovery.add_error_pattern("RuntimeError", ErrorType.TIMEOUT, ["Custom."])
+        recovery.add_message_pattern(r"rate limit exceeded", ErrorType.TIMEOUT, ["Rate limited."])
+
+        assert "RuntimeError" not in ERROR_PATTERNS
+        assert len(MESSAGE_PATTERNS) == len(ErrorRecovery()._message_patterns)
+        assert recovery.handle_tool_error("shell", RuntimeError("x")).error_type == ErrorType.TIMEOUT
+        assert other.handle_tool_error("shell", RuntimeError("rate limit exceeded")).error_type == ErrorType.UNKNOWN
+
     def test_module_placeholder_replacement(self, recovery: ErrorRecovery) -> None:
         """Test module placeholder is replaced in suggestions."""
 
@@ -310,26 +421,11 @@ class TestPropertyBased:
         assert len(action.suggestions) >= 1
 
     @settings(max_examples=30)
-    @given(
-        st.sampled_from(list(ERROR_PATTERNS.keys())).filter(
-            lambda x: "." not in x  # Skip dotted names that need imports
-        )
-    )
+    @given(st.sampled_from(sorted(_BUILTIN_PATTERN_CLASSES)))
     def test_all_builtin_patterns_match(self, pattern_name: str) -> None:
         """Test that builtin exception patterns are recognized."""
         recovery = ErrorRecovery()
-
-        # Create exception instance
-        builtins_dict = __builtins__ if isinstance(__builtins__, dict) else vars(__builtins__)
-        exc_class = builtins_dict.get(pattern_name)
-        if exc_class is None:
-            pytest.skip(f"Exception {pattern_name} not found in builtins")
-
-        try:
-            error = exc_class("test error")
-        except TypeError:
-            # Some exceptions require specific args
-            pytest.skip(f"Cannot instantiate {pattern_name}")
+        error = _BUILTIN_PATTERN_CLASSES[pattern_name]("test error")
 
         action = recovery.handle_tool_error("test_tool", error)
 
@@ -340,9 +436,9 @@ class TestPropertyBased:
 class TestIntegration:
     """Integration tests for error recovery in tool execution context."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def recovery(self) -> ErrorRecovery:
-        """Create ErrorRecovery instance."""
+        """Create an ErrorRecovery instance shared by the class (tests only read from it)."""
         return ErrorRecovery()
 
     def test_filesystem_error_flow(self, recovery: ErrorRecovery) -> None:
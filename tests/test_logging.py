@@ -541,7 +541,7 @@ class TestPropertyBased:
         result = redact_sensitive(content)
         assert isinstance(result, str)
 
-    @given(level=st.sampled_from(list(VALID_LOG_LEVELS)))
+    @given(level=st.sampled_from(sorted(VALID_LOG_LEVELS)))
     @settings(max_examples=10, suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_setup_logging_accepts_all_valid_levels(self, tmp_path: Path, level: str) -> None:
         """setup_logging accepts all valid log levels."""
@@ -116,3 +116,37 @@ async def test_tool_decorator_default_category():
     definition: ToolDefinition = default_cat_tool._tool_definition
 
     assert definition.category == ToolCategory.SHELL
+
+
+def test_function_spec_wraps_schema():
+    """function_spec wraps the schema for the LLM."""
+
+    @tool(name="spec_tool", description="Spec tool")
+    async def spec_tool(x: int) -> int:
+        return x
+
+    definition: ToolDefinition = spec_tool._tool_definition
+    spec = definition.function_spec
+
+    assert spec == {
+        "type": "function",
+        "function": {"name": "spec_tool", "description": "Spec tool", "parameters": definition.input_schema},
+    }
+
+
+def test_function_spec_mutation_does_not_leak():
+    """Changes to a returned spec don't reach the definition or later specs."""
+
+    @tool(name="spec_tool", description="Spec tool")
+    async def spec_tool(x: int) -> int:
+        return x
+
+    definition: ToolDefinition = spec_tool._tool_definition
+    expected = definition.function_spec
+
+    spec = definition.function_spec
+    spec["strict"] = True
+    spec["function"]["parameters"]["properties"]["y"] = {"type": "string"}
+
+    assert definition.function_spec == expected
+    assert "y" not in definition.input_schema["properties"]
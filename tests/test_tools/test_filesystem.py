@@ -32,6 +32,13 @@ async def test_read_file_not_found(tmp_path):
         await read_file(str(p))
 
 
+@pytest.mark.asyncio
+async def test_read_file_under_a_file_not_found(tmp_path):
+    (tmp_path / "some_file.txt").write_text("content")
+    with pytest.raises(FileNotFoundError, match="File not found"):
+        await read_file(str(tmp_path / "some_file.txt" / "child"))
+
+
 @pytest.mark.asyncio
 async def test_read_file_is_directory(tmp_path):
     """Test that reading a directory raises IsADirectoryError (covers line 35)."""
@@ -39,6 +46,29 @@ async def test_read_file_is_directory(tmp_path):
         await read_file(str(tmp_path))
 
 
+@pytest.mark.asyncio
+async def test_read_file_normalizes_newlines(tmp_path):
+    """Test that CRLF and CR line endings read back as LF, as in text mode."""
+    f = tmp_path / "crlf.txt"
+    f.write_bytes(b"one\r\ntwo\rthree\n")
+
+    assert await read_file(str(f)) == "one\ntwo\nthree\n"
+
+
+@pytest.mark.asyncio
+async def test_read_file_truncates_on_char_boundary(tmp_path):
+    """Test that large files are cut after MAX_FILE_SIZE whole characters."""
+    from chapgent.tools.filesystem import MAX_FILE_SIZE
+
+    f = tmp_path / "big.txt"
+    f.write_text("\u00e9" * MAX_FILE_SIZE, encoding="utf-8")
+
+    content = await read_file(str(f))
+    head, _, notice = content.partition("\n\n")
+    assert head == "\u00e9" * MAX_FILE_SIZE
+    assert notice.startswith(f"[TRUNCATED: File is {2 * MAX_FILE_SIZE:,} bytes")
+
+
 @pytest.mark.asyncio
 async def test_list_files(tmp_path):
     (tmp_path / "a.txt").touch()
@@ -69,6 +99,37 @@ async def test_list_files_directory_not_found(tmp_path):
         await list_files(str(non_existent))
 
 
+@pytest.mark.asyncio
+async def test_list_files_recursive_is_breadth_first_and_truncates(tmp_path):
+    """Test that a truncated recursive listing keeps shallow entries first."""
+    from chapgent.tools.filesystem import MAX_LIST_ENTRIES
+
+    (tmp_path / "deep").mkdir()
+    for i in range(MAX_LIST_ENTRIES):
+        (tmp_path / "deep" / f"{i}.txt").touch()
+    (tmp_path / "top.txt").touch()
+
+    result = await list_files(str(tmp_path), recursive=True)
+    listing, _, notice = result.partition("\n\n")
+    entries = json.loads(listing)
+
+    assert len(entries) == MAX_LIST_ENTRIES
+    assert {e["path"] for e in entries[:2]} == {"deep", "top.txt"}
+    assert notice.startswith("[TRUNCATED")
+
+
+@pytest.mark.asyncio
+async def test_list_files_recursive_does_not_follow_symlink_loops(tmp_path):
+    """Test that a symlinked directory is listed but not descended into."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    entries = json.loads(await list_files(str(tmp_path), recursive=True))
+
+    assert sorted(e["path"] for e in entries) == ["sub", "sub/loop"]
+    assert all(e["is_dir"] for e in entries)
+
+
 @pytest.mark.asyncio
 async def test_edit_file(tmp_path):
     f = tmp_path / "code.py"
@@ -80,6 +141,28 @@ async def test_edit_file(tmp_path):
     assert content == "print('hello')\nprint('universe')"
 
 
+@pytest.mark.asyncio
+async def test_edit_file_replaces_every_occurrence(tmp_path):
+    """Test that all occurrences are replaced, including non-ASCII text."""
+    f = tmp_path / "notes.txt"
+    f.write_text("caf\u00e9 and caf\u00e9\n", encoding="utf-8")
+
+    await edit_file(str(f), "caf\u00e9", "tea")
+
+    assert f.read_text(encoding="utf-8") == "tea and tea\n"
+
+
+@pytest.mark.asyncio
+async def test_edit_file_crlf_matches_text_mode(tmp_path):
+    """Test that CRLF files still match LF search strings, as in text mode."""
+    f = tmp_path / "dos.txt"
+    f.write_bytes(b"one\r\ntwo\r\n")
+
+    await edit_file(str(f), "one\ntwo", "1\n2")
+
+    assert f.read_text(encoding="utf-8") == "1\n2\n"
+
+
 @pytest.mark.asyncio
 async def test_edit_file_string_not_found(tmp_path):
     """Test that editing with non-existent string raises ValueError."""
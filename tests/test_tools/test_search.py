@@ -7,6 +7,7 @@ Tests verify user-facing behavior:
 """
 
 import json
+from pathlib import Path
 
 import pytest
 
@@ -54,6 +55,22 @@ class TestGrepSearch:
         for r in data["results"]:
             assert r["file"].endswith(".py")
 
+    @pytest.mark.asyncio
+    async def test_filters_by_path_pattern(self, tmp_path):
+        """A file pattern with a directory part matches that directory at any depth."""
+        from unittest.mock import patch
+
+        for rel in ["src/app.py", "lib/src/util.py", "src/pkg/deep.py", "other/app.py", ".cache/src/x.py"]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("def func(): pass")
+
+        with patch("chapgent.tools.search._is_ripgrep_available", return_value=False):
+            result = await grep_search("def", str(tmp_path), file_pattern="src/*.py")
+        data = json.loads(result)
+
+        found = sorted(str(Path(r["file"]).relative_to(tmp_path)) for r in data["results"])
+        assert found == ["lib/src/util.py", "src/app.py"]
+
     @pytest.mark.asyncio
     async def test_case_insensitive_search(self, tmp_path):
         """Case-insensitive search finds all case variations."""
@@ -120,6 +137,22 @@ class TestGrepSearch:
         assert data["count"] == 1
         assert "app.js" in data["results"][0]["file"]
 
+    @pytest.mark.asyncio
+    async def test_python_backend_searches_inside_hidden_root(self, tmp_path):
+        """Only directories below the search root are filtered, not the root's own path."""
+        from unittest.mock import patch
+
+        root = tmp_path / ".config" / "project"
+        (root / "pkg").mkdir(parents=True)
+        (root / "pkg" / "mod.py").write_text("findme")
+        (root / "pkg" / "__pycache__").mkdir()
+        (root / "pkg" / "__pycache__" / "mod.py").write_text("findme")
+
+        with patch("chapgent.tools.search._is_ripgrep_available", return_value=False):
+            data = json.loads(await grep_search("findme", str(root), file_pattern="*.py"))
+
+        assert [r["file"] for r in data["results"]] == [str(root / "pkg" / "mod.py")]
+
     @pytest.mark.asyncio
     async def test_returns_line_numbers(self, tmp_path):
         """Results include accurate line numbers."""
@@ -130,6 +163,217 @@ class TestGrepSearch:
 
         assert data["results"][0]["line"] == 2
 
+    @pytest.mark.asyncio
+    async def test_python_backend_counts_lines_like_ripgrep(self, tmp_path):
+        """Only newlines end a line, so line numbers agree with ripgrep."""
+        from unittest.mock import patch
+
+        (tmp_path / "code.c").write_bytes(b"one\x0ctwo\r\nthree\n")
+
+        with patch("chapgent.tools.search._is_ripgrep_available", return_value=False):
+            data = json.loads(await grep_search("three", str(tmp_path)))
+
+        assert data["results"][0]["line"] == 2
+        assert data["results"][0]["content"] == "three"
+
+    @pytest.mark.parametrize("pattern", ["foo", "foo(bar|baz)", r"def \w+", "ab*c", "abc?d", "x{2}"])
+    def test_literal_prefilter_agrees_with_line_scan(self, tmp_path, pattern):
+        """Jumping to literal-prefix candidates finds the same matches as a full scan."""
+        import re
+
+        from chapgent.tools.search import _literal_prefix, _search_file
+
+        f = tmp_path / "mixed.txt"
+        f.write_text("foobar foobaz\r\ndef f_x(): foo\nacd abd abcd\n\nxx ac\nfoo\n", encoding="utf-8")
+        regex = re.compile(pattern)
+
+        prefiltered = list(_search_file(regex, f, _literal_prefix(pattern)))
+        scanned = list(_search_file(regex, f))
+
+        assert prefiltered == scanned
+        assert scanned
+
+    @pytest.mark.parametrize("threshold", [0, 1 << 20])
+    def test_literal_prefilter_reads_mapped_and_buffered_files(self, tmp_path, monkeypatch, threshold):
+        """Files are checked for the literal via mmap above the threshold, and read below it."""
+        import re
+
+        from chapgent.tools import search
+
+        monkeypatch.setattr(search, "MMAP_THRESHOLD", threshold)
+        hit = tmp_path / "hit.log"
+        hit.write_text("noise\n" * 100 + "ERROR disk full\n", encoding="utf-8")
+        miss = tmp_path / "miss.log"
+        miss.write_text("noise\n" * 100, encoding="utf-8")
+        regex = re.compile(r"ERROR \w+")
+
+        assert next(search._search_file(regex, hit, "ERROR "))["line"] == 101
+        assert list(search._search_file(regex, miss, "ERROR ")) == []
+
+
+class TestGrepRipgrepBackend:
+    """ripgrep is invoked with safe, efficient arguments."""
+
+    @staticmethod
+    def _rg_process(stdout: bytes = b"", limit: int = 2**16):
+        import asyncio
+        from unittest.mock import AsyncMock, MagicMock
+
+        reader = asyncio.StreamReader(limit=limit)
+        reader.feed_data(stdout)
+        reader.feed_eof()
+
+        process = MagicMock()
+        process.stdout = reader
+        process.returncode = None
+        process.wait = AsyncMock(return_value=0)
+        return process
+
+    @staticmethod
+    def _rg_lines(*events: dict) -> bytes:
+        """Encode events the way rg --json does: compact, one per line."""
+        return b"".join(json.dumps(event, separators=(",", ":")).encode() + b"\n" for event in events)
+
+    def test_availability_is_checked_once(self):
+        """The PATH lookup for rg is not repeated on every search."""
+        from unittest.mock import patch
+
+        from chapgent.tools.search import _is_ripgrep_available
+
+        _is_ripgrep_available.cache_clear()
+        try:
+            with patch("chapgent.tools.search.shutil.which", return_value="/usr/bin/rg") as which:
+                assert _is_ripgrep_available() is True
+                assert _is_ripgrep_available() is True
+            which.assert_called_once_with("rg")
+        finally:
+            _is_ripgrep_available.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_only_match_events_are_reported(self, tmp_path):
+        """Context lines are skipped even when their text looks like a match event."""
+        from unittest.mock import AsyncMock, patch
+
+        def event(kind: str, text: str, line_number: int) -> dict:
+            return {
+                "type": kind,
+                "data": {
+                    "path": {"text": "a.json"},
+                    "lines": {"text": text},
+                    "line_number": line_number,
+                    "submatches": [{"match": {"text": "needle"}}] if kind == "match" else [],
+                },
+            }
+
+        stdout = self._rg_lines(
+            {"type": "begin", "data": {"path": {"text": "a.json"}}},
+            event("context", '{"type":"match"}\n', 1),
+            event("match", "needle\n", 2),
+            {"type": "end", "data": {"path": {"text": "a.json"}}},
+        )
+        exec_mock = AsyncMock(return_value=self._rg_process(stdout + b'{"type":"match", truncated\n'))
+        with (
+            patch("chapgent.tools.search._is_ripgrep_available", return_value=True),
+            patch("asyncio.create_subprocess_exec", exec_mock),
+        ):
+            data = json.loads(await grep_search("needle", str(tmp_path), context_lines=1))
+
+        assert [r["line"] for r in data["results"]] == [2]
+
+    @pytest.mark.asyncio
+    async def test_event_longer_than_stream_limit_is_skipped(self, tmp_path):
+        """An oversized event is dropped and the events after it are still read."""
+        from unittest.mock import AsyncMock, patch
+
+        def event(name: str, text: str) -> dict:
+            return {
+                "type": "match",
+                "data": {
+                    "path": {"text": name},
+                    "lines": {"text": text + "\n"},
+                    "line_number": 1,
+                    "submatches": [{"match": {"text": "needle"}}],
+                },
+            }
+
+        stdout = self._rg_lines(event("big.min.js", "needle" + "x" * 1000), event("small.js", "needle"))
+        process = self._rg_process(stdout, limit=256)
+        with (
+            patch("chapgent.tools.search._is_ripgrep_available", return_value=True),
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+        ):
+            data = json.loads(await grep_search("needle", str(tmp_path)))
+
+        assert [r["file"] for r in data["results"]] == ["small.js"]
+
+    @pytest.mark.asyncio
+    async def test_stops_ripgrep_at_max_results(self, tmp_path):
+        """Once max_results matches are read, ripgrep is killed and reaped."""
+        from unittest.mock import AsyncMock, patch
+
+        events = [
+            {
+                "type": "match",
+                "data": {
+                    "path": {"text": f"{i}.txt"},
+                    "lines": {"text": "needle\n"},
+                    "line_number": 1,
+                    "submatches": [{"match": {"text": "needle"}}],
+                },
+            }
+            for i in range(5)
+        ]
+        process = self._rg_process(self._rg_lines(*events))
+        with (
+            patch("chapgent.tools.search._is_ripgrep_available", return_value=True),
+            patch("asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+        ):
+            data = json.loads(await grep_search("needle", str(tmp_path), max_results=2))
+
+        assert [r["file"] for r in data["results"]] == ["0.txt", "1.txt"]
+        process.kill.assert_called_once()
+        process.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_literal_pattern_uses_fixed_strings(self, tmp_path):
+        """Patterns without regex syntax are searched as fixed strings."""
+        from unittest.mock import AsyncMock, patch
+
+        exec_mock = AsyncMock(return_value=self._rg_process())
+        with (
+            patch("chapgent.tools.search._is_ripgrep_available", return_value=True),
+            patch("asyncio.create_subprocess_exec", exec_mock),
+        ):
+            await grep_search("-needle here", str(tmp_path))
+
+        cmd = exec_mock.call_args.args
+        assert "--fixed-strings" in cmd
+        assert cmd[-3:] == ("--", "-needle here", str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_regex_pattern_is_not_fixed(self, tmp_path):
+        """Patterns with regex syntax are passed to ripgrep as regexes."""
+        from unittest.mock import AsyncMock, patch
+
+        match = {
+            "type": "match",
+            "data": {
+                "path": {"text": "a.py"},
+                "lines": {"text": "def foo_bar():\n"},
+                "line_number": 3,
+                "submatches": [{"match": {"text": "def foo_bar"}}],
+            },
+        }
+        exec_mock = AsyncMock(return_value=self._rg_process(self._rg_lines(match)))
+        with (
+            patch("chapgent.tools.search._is_ripgrep_available", return_value=True),
+            patch("asyncio.create_subprocess_exec", exec_mock),
+        ):
+            data = json.loads(await grep_search(r"def \w+", str(tmp_path)))
+
+        assert "--fixed-strings" not in exec_mock.call_args.args
+        assert data["results"] == [{"file": "a.py", "line": 3, "content": "def foo_bar():", "match": "def foo_bar"}]
+
 
 # =============================================================================
 # find_files - User can find files by pattern
@@ -232,6 +476,165 @@ class TestFindFiles:
 
         assert not any("__pycache__" in f for f in data["files"])
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "*.py",
+            "**/*.py",
+            "src/*.py",
+            "src/**/*.py",
+            "**/test_*.py",
+            "*",
+            "*/",
+            "**",
+            "src/**",
+            "*/*/*.txt",
+            "src/pkg/*.py",
+            "src/pkg",
+            "missing/*.py",
+            "app.py/*",
+            "app.py",
+            "src/core.py",
+            "src/build.py/",
+            "src/core.py/",
+            "**/*",
+            "src/*",
+            "src/*.{py,txt}",
+        ],
+    )
+    async def test_matches_pathlib_glob(self, tmp_path, pattern):
+        """Matches what Path.glob returns for the same pattern."""
+        for rel in [
+            "app.py",
+            "src/core.py",
+            "src/odd.{py,txt}",
+            "src/pkg/test_core.py",
+            "src/pkg/data/notes.txt",
+            "docs/a/b.txt",
+        ]:
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("")
+        (tmp_path / "src" / "build.py").mkdir()
+
+        result = await find_files(pattern, str(tmp_path))
+        data = json.loads(result)
+
+        expected = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.glob(pattern))
+        assert data["files"] == expected
+
+    @pytest.mark.asyncio
+    async def test_literal_directories_are_not_listed(self, tmp_path, monkeypatch):
+        """Literal leading directories in the pattern are stepped into, not scanned."""
+        import os
+
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.py").write_text("")
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(os.fspath(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+
+        result = await find_files("src/pkg/*.py", str(tmp_path))
+        data = json.loads(result)
+
+        assert data["files"] == ["src/pkg/mod.py"]
+        assert scanned == [str(tmp_path / "src" / "pkg")]
+
+    @pytest.mark.asyncio
+    async def test_pattern_without_wildcards_lists_nothing(self, tmp_path, monkeypatch):
+        """A pattern naming one path is answered without listing any directory."""
+        import os
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("")
+        monkeypatch.setattr(os, "scandir", lambda path: pytest.fail(f"listed {path}"))
+
+        found = json.loads(await find_files("src/main.py", str(tmp_path)))
+        missing = json.loads(await find_files("src/other.py", str(tmp_path)))
+        wrong_type = json.loads(await find_files("src/main.py", str(tmp_path), file_type="directory"))
+
+        assert found["files"] == ["src/main.py"]
+        assert missing["files"] == []
+        assert wrong_type["files"] == []
+
+    @pytest.mark.asyncio
+    async def test_repeated_pattern_is_compiled_once(self, tmp_path):
+        """Searching again with the same pattern reuses the compiled glob."""
+        from chapgent.tools.search import _compile_glob
+
+        (tmp_path / "app.py").write_text("")
+        _compile_glob.cache_clear()
+
+        first = await find_files("**/*.py", str(tmp_path))
+        second = await find_files("**/*.py", str(tmp_path))
+
+        assert first == second
+        info = _compile_glob.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_truncates_at_result_limit(self, tmp_path, monkeypatch):
+        """The first results in name order are kept and the response says so."""
+        from chapgent.tools import search
+
+        monkeypatch.setattr(search, "MAX_FIND_RESULTS", 3)
+        for i in range(5):
+            (tmp_path / f"f{i}.py").write_text("")
+
+        result = await find_files("*.py", str(tmp_path))
+        data = json.loads(result)
+
+        assert data["files"] == ["f0.py", "f1.py", "f2.py"]
+        assert data["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_exact_result_limit_is_not_truncated(self, tmp_path, monkeypatch):
+        """Exactly as many matches as the limit is not reported as truncated."""
+        from chapgent.tools import search
+
+        monkeypatch.setattr(search, "MAX_FIND_RESULTS", 3)
+        for i in range(3):
+            (tmp_path / f"f{i}.py").write_text("")
+
+        result = await find_files("*.py", str(tmp_path))
+        data = json.loads(result)
+
+        assert data["count"] == 3
+        assert "truncated" not in data
+
+    @pytest.mark.asyncio
+    async def test_no_directory_is_listed_beyond_max_depth(self, tmp_path, monkeypatch):
+        """A starting directory already at max_depth is not listed."""
+        import os
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("")
+        monkeypatch.setattr(os, "scandir", lambda path: pytest.fail(f"listed {path}"))
+
+        nested = json.loads(await find_files("src/*.py", str(tmp_path), max_depth=1))
+        top = json.loads(await find_files("*.py", str(tmp_path), max_depth=0))
+
+        assert nested["files"] == []
+        assert top["files"] == []
+
+    @pytest.mark.asyncio
+    async def test_max_depth_limits_recursive_pattern(self, tmp_path):
+        """Max depth applies to matches found through "**"."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.py").write_text("")
+        (tmp_path / "a" / "mid.py").write_text("")
+        (tmp_path / "a" / "b" / "low.py").write_text("")
+
+        result = await find_files("**/*.py", str(tmp_path), max_depth=2)
+        data = json.loads(result)
+
+        assert data["files"] == ["a/mid.py", "top.py"]
+
 
 # =============================================================================
 # find_definition - User can find where symbols are defined
@@ -253,6 +656,17 @@ class TestFindDefinition:
         assert data["definitions"][0]["type"] == "function"
         assert "def calculate_total" in data["definitions"][0]["context"]
 
+    @pytest.mark.asyncio
+    async def test_reports_first_matching_kind_with_line_numbers(self, tmp_path):
+        """Each definition line reports the first matching kind; usages are ignored."""
+        (tmp_path / "api.ts").write_text(
+            "import { x } from './x';\n\nconst total = 1;\nconsole.log(total);\nexport const total = 2;\n"
+        )
+
+        data = json.loads(await find_definition("total", str(tmp_path)))
+
+        assert [(d["line"], d["type"]) for d in data["definitions"]] == [(3, "const"), (5, "exported const")]
+
     @pytest.mark.asyncio
     async def test_finds_python_async_function(self, tmp_path):
         """Finds Python async function definitions."""
@@ -386,3 +800,24 @@ class TestErrorHandling:
         """find_definition raises FileNotFoundError for nonexistent path."""
         with pytest.raises(FileNotFoundError):
             await find_definition("symbol", "/nonexistent/path/xyz")
+
+    @pytest.mark.asyncio
+    async def test_find_files_raises_for_file_path(self, tmp_path):
+        """find_files raises NotADirectoryError when given a file."""
+        target = tmp_path / "app.py"
+        target.write_text("")
+
+        with pytest.raises(NotADirectoryError):
+            await find_files("*.py", str(target))
+
+    @pytest.mark.asyncio
+    async def test_find_definition_searches_single_file(self, tmp_path):
+        """find_definition accepts a file path and searches only that file."""
+        target = tmp_path / "app.py"
+        target.write_text("def main():\n    pass\n")
+        (tmp_path / "other.py").write_text("def main():\n    pass\n")
+
+        result = await find_definition("main", str(target))
+        data = json.loads(result)
+
+        assert data["count"] == 1
@@ -123,6 +123,20 @@ tests/test_foo.py::test_skip SKIPPED
         assert summary.passed == 1
         assert summary.skipped == 1
 
+    @pytest.mark.asyncio
+    async def test_parses_final_pytest_summary(self):
+        """Summary-like lines printed by tests don't override the real summary."""
+        output = """
+tests/test_foo.py::test_one PASSED
+=== 9 passed in 9.99s === (printed by a test)
+tests/test_foo.py::test_two FAILED
+=========================== 1 passed, 1 failed in 0.23s ========================
+"""
+        summary = await parse_test_output(output, TestFramework.PYTEST)
+        assert summary.passed == 1
+        assert summary.failed == 1
+        assert summary.duration == 0.23
+
     @pytest.mark.asyncio
     async def test_parses_jest_output(self):
         """Parse Jest output."""
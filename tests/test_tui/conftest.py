@@ -1,6 +1,8 @@
 """Shared fixtures and helpers for TUI tests."""
 
 from chapgent.tui.app import ChapgentApp
+from chapgent.tui.markdown import MarkdownMessage
+from chapgent.tui.widgets import ConversationPanel
 
 
 def get_binding(action: str) -> str:
@@ -19,3 +21,15 @@ def get_binding(action: str) -> str:
         if bound_action == action:
             return key
     raise ValueError(f"No keybinding found for action: {action}")
+
+
+def get_messages(panel: ConversationPanel) -> tuple[MarkdownMessage, ...]:
+    """Get the messages mounted in a conversation panel, in order.
+
+    Args:
+        panel: The conversation panel to inspect.
+
+    Returns:
+        The MarkdownMessage widgets under #conversation-messages.
+    """
+    return tuple(panel.query_one("#conversation-messages").query(MarkdownMessage))
@@ -32,6 +32,19 @@ class TestConversationPanelMessages:
             assert msg.role == "user"
             assert "Hello **world**" in msg.content
 
+    @pytest.mark.asyncio
+    async def test_appended_messages_can_be_awaited_until_mounted(self):
+        """Awaiting an append waits for that message to be mounted."""
+        app = ChapgentApp()
+        async with app.run_test():
+            panel = app.query_one(ConversationPanel)
+            await panel.append_user_message("Hello")
+            await panel.append_assistant_message("Hi")
+
+            messages = panel.query(MarkdownMessage)
+            assert [msg.role for msg in messages] == ["user", "agent"]
+            assert all(msg.is_mounted for msg in messages)
+
     @pytest.mark.asyncio
     async def test_agent_message_renders_markdown(self):
         """Agent messages should render with markdown support."""